@@ -35,10 +35,14 @@ from shared.db_utils import (
     get_club_by_id,
     get_team_by_id,
     get_teams_by_club,
+    get_teams_by_ids,
     get_player_by_id,
+    get_players_by_ids,
+    get_players_by_club,
     get_activities_by_team,
     get_activities_by_club,
     get_all_content_pages_by_club,
+    CONTENT_PAGE_SUMMARY_FIELDS,
     get_tracking_by_week,
     get_coach_by_email,
     get_coaches_by_team,
@@ -47,8 +51,13 @@ from shared.db_utils import (
     get_club_admin_by_id,
     get_coach_by_id,
     update_user_verification_status,
+    batch_reads,
+    invalidate_club,
+    invalidate_team,
+    invalidate_coach,
+    invalidate_club_admin,
 )
-from shared.auth_utils import extract_user_info_from_event, extract_user_info_from_jwt_token, verify_admin_role, verify_app_admin_role
+from shared.auth_utils import extract_user_info_from_event, extract_user_info_from_jwt_token, clear_user_info_cache, normalize_groups, verify_admin_role, verify_app_admin_role
 from shared.flask_auth import get_api_gateway_event
 from shared.html_sanitizer import sanitize_html
 from shared.week_utils import get_current_week_id, get_week_id, get_week_dates
@@ -443,8 +452,11 @@ def get_cognito_groups_for_club(club_id: str) -> List[str]:
     """
     groups = []
     
-    # Get club record to get club name
-    club = get_club_by_id(club_id)
+    # Get club record (for the club name) and all teams for the club concurrently
+    club, teams = batch_reads(
+        lambda: get_club_by_id(club_id),
+        lambda: get_teams_by_club(club_id),
+    )
     if not club:
         return groups
     
@@ -455,8 +467,6 @@ def get_cognito_groups_for_club(club_id: str) -> List[str]:
         club_admin_group = f"club-{sanitized_name}-admins"
         groups.append(club_admin_group)
     
-    # Get all teams for the club
-    teams = get_teams_by_club(club_id)
     for team in teams:
         team_id = team.get("teamId")
         if team_id:
@@ -1177,12 +1187,7 @@ def check_role():
         # Debug: Log user info and groups
         groups_raw = user_info.get("groups", [])
         # Ensure groups is always a list (handle case where it's a string)
-        if isinstance(groups_raw, str):
-            groups = [g.strip() for g in groups_raw.split(",") if g.strip()]
-        elif isinstance(groups_raw, list):
-            groups = groups_raw
-        else:
-            groups = []
+        groups = normalize_groups(groups_raw)
         
         print(f"DEBUG check_role: User email: {user_info.get('email')}")
         print(f"DEBUG check_role: User groups (raw): {groups_raw}, type: {type(groups_raw)}")
@@ -1206,6 +1211,8 @@ def check_role():
             claims["sub"] = user_info.get("user_id")
             claims["cognito:groups"] = groups  # This is now guaranteed to be a list
             print(f"DEBUG check_role: Created authorizer claims from user_info, groups: {groups}")
+            # The event's memoized user info predates these claims
+            clear_user_info_cache(event)
         
         is_admin = verify_admin_role(event)
         is_app_admin = verify_app_admin_role(event)
@@ -1512,6 +1519,7 @@ def update_club(club_id):
     )
     
     # Get updated club
+    invalidate_club(club_id)
     updated = get_club_by_id(club_id)
     return flask_success_response({"club": updated})
 
@@ -1735,6 +1743,7 @@ def update_club_admin(club_id, admin_id):
             },
             ReturnValues="ALL_NEW"
         )
+        invalidate_club_admin(admin_id)
         updated_admin = table.get_item(Key={"adminId": admin_id}).get("Item")
     except Exception as e:
         print(f"Error updating club admin {admin_id}: {e}")
@@ -1812,6 +1821,7 @@ def delete_club_admin(club_id, admin_id):
                 ":updatedAt": datetime.utcnow().isoformat() + "Z"
             }
         )
+        invalidate_club_admin(admin_id)
     except Exception as e:
         print(f"Error updating DynamoDB record for admin {admin_id}: {e}")
         return flask_error_response("Failed to deactivate club admin", status_code=500)
@@ -1859,6 +1869,7 @@ def disable_club(club_id):
         print(f"Disabled club {club_id}: removed {total_removed} users from {len(groups)} groups")
     
     # Get updated club
+    invalidate_club(club_id)
     updated = get_club_by_id(club_id)
     return flask_success_response({"club": updated, "message": "Club disabled successfully"})
 
@@ -1892,6 +1903,7 @@ def enable_club(club_id):
     )
     
     # Get updated club
+    invalidate_club(club_id)
     updated = get_club_by_id(club_id)
     return flask_success_response({
         "club": updated,
@@ -2212,6 +2224,7 @@ def update_team(team_id):
     )
     
     # Get updated team
+    invalidate_team(team_id)
     updated = get_team_by_id(team_id)
     return flask_success_response({"team": updated})
 
@@ -2249,6 +2262,7 @@ def activate_team(team_id):
     )
     
     # Get updated team
+    invalidate_team(team_id)
     updated = get_team_by_id(team_id)
     return flask_success_response({"team": updated, "message": "Team activated successfully"})
 
@@ -2286,6 +2300,7 @@ def deactivate_team(team_id):
     )
     
     # Get updated team
+    invalidate_team(team_id)
     updated = get_team_by_id(team_id)
     return flask_success_response({"team": updated, "message": "Team deactivated successfully"})
 
@@ -2515,6 +2530,7 @@ def remove_team_coach(team_id, coach_email):
                 ":updatedAt": datetime.utcnow().isoformat() + "Z"
             }
         )
+        invalidate_coach(coach.get("coachId"))
     except Exception as e:
         print(f"Error updating DynamoDB record for coach {coach_email}: {e}")
         # Continue anyway - Cognito group removal succeeded
@@ -2579,6 +2595,7 @@ def activate_team_coach(team_id, coach_email):
             },
             ReturnValues="ALL_NEW"
         )
+        invalidate_coach(coach.get("coachId"))
         updated_coach = table.get_item(Key={"coachId": coach.get("coachId")}).get("Item")
     except Exception as e:
         print(f"Error updating DynamoDB record for coach {coach_email}: {e}")
@@ -2654,6 +2671,7 @@ def deactivate_team_coach(team_id, coach_email):
             },
             ReturnValues="ALL_NEW"
         )
+        invalidate_coach(coach.get("coachId"))
         updated_coach = table.get_item(Key={"coachId": coach.get("coachId")}).get("Item")
     except Exception as e:
         print(f"Error updating DynamoDB record for coach {coach_email}: {e}")
@@ -2716,6 +2734,7 @@ def update_team_coach(team_id, coach_id):
             },
             ReturnValues="ALL_NEW"
         )
+        invalidate_coach(coach_id)
         updated_coach = table.get_item(Key={"coachId": coach_id}).get("Item")
     except Exception as e:
         print(f"Error updating coach {coach_id}: {e}")
@@ -2826,7 +2845,13 @@ def list_players():
     # Format response with club and team names
     player_list = []
     club_cache = {}  # Cache club lookups
-    team_cache = {}  # Cache team lookups
+    # Resolve every team name with one batched read
+    team_cache = {
+        team_id: team.get("teamName")
+        for team_id, team in get_teams_by_ids(
+            [player.get("teamId") for player in players], projection=["teamName"]
+        ).items()
+    }
     
     for player in players:
         player_club_id = player.get("clubId")
@@ -2841,12 +2866,7 @@ def list_players():
             club_name = club_cache[player_club_id]
         
         # Get team name
-        team_name = None
-        if player_team_id:
-            if player_team_id not in team_cache:
-                team = get_team_by_id(player_team_id)
-                team_cache[player_team_id] = team.get("teamName") if team else None
-            team_name = team_cache[player_team_id]
+        team_name = team_cache.get(player_team_id) if player_team_id else None
         
         player_list.append({
             "playerId": player.get("playerId"),
@@ -3663,7 +3683,7 @@ def delete_activity(activity_id):
 def list_content():
     """List all content pages in club."""
     club_id = g.club_id
-    content_pages = get_all_content_pages_by_club(club_id, published_only=False)
+    content_pages = get_all_content_pages_by_club(club_id, published_only=False, projection=CONTENT_PAGE_SUMMARY_FIELDS)
     
     # Format response (exclude full HTML content from list view)
     content_list = []
@@ -3748,7 +3768,9 @@ def create_content():
     sanitized_html = sanitize_html(html_content)
     
     # Get max displayOrder to append new content (check against all club content)
-    existing_content = get_all_content_pages_by_club(club_id, published_only=False)
+    existing_content = get_all_content_pages_by_club(
+        club_id, published_only=False, projection=["pageId", "slug", "displayOrder"]
+    )
     if display_order == 999 and existing_content:
         max_order = max(c.get("displayOrder", 0) for c in existing_content)
         display_order = max_order + 1
@@ -3828,7 +3850,9 @@ def update_content(content_id):
     if "slug" in body:
         # Check if new slug already exists (check against all club content)
         new_slug = body["slug"]
-        existing_content_list = get_all_content_pages_by_club(club_id, published_only=False)
+        existing_content_list = get_all_content_pages_by_club(
+            club_id, published_only=False, projection=["pageId", "slug"]
+        )
         for content in existing_content_list:
             if content.get("pageId") != content_id and content.get("slug") == new_slug:
                 return flask_error_response(f"Slug '{new_slug}' already exists", status_code=400)
@@ -4086,22 +4110,14 @@ def overview():
     
     current_week_id = get_current_week_id()
     
-    # Get all players in club
-    player_table = get_table("ConsistencyTracker-Players")
-    players_response = player_table.query(
-        IndexName="clubId-index",
-        KeyConditionExpression="clubId = :clubId",
-        ExpressionAttributeValues={":clubId": club_id},
+    # Get active players, activities and current week tracking concurrently
+    active_players, club_activities, tracking_records = batch_reads(
+        lambda: get_players_by_club(club_id, active_only=True, projection=["playerId", "name"]),
+        lambda: get_activities_by_club(club_id, active_only=True, projection=["activityId", "name"]),
+        lambda: get_tracking_by_week(current_week_id, projection=["playerId", "dailyScore", "clubId"]),
     )
-    players = players_response.get("Items", [])
-    active_players = [p for p in players if p.get("isActive", True)]
-    
-    # Get activities (club-wide + team-specific)
-    club_activities = get_activities_by_club(club_id, active_only=True)
     activities = club_activities  # Can be filtered by team if needed
     
-    # Get current week tracking
-    tracking_records = get_tracking_by_week(current_week_id)
     club_tracking = [t for t in tracking_records if t.get("clubId") == club_id]
     
     # Calculate statistics
@@ -4181,14 +4197,23 @@ def export_week(week_id):
     except Exception:
         return flask_error_response("Invalid weekId format (expected YYYY-WW)", status_code=400)
     
-    # Get tracking records for the week
-    tracking_records = get_tracking_by_week(week_id)
+    # Get tracking records for the week and activities (club-wide + team-specific) concurrently
+    tracking_records, club_activities = batch_reads(
+        lambda: get_tracking_by_week(
+            week_id, projection=["playerId", "date", "completedActivities", "dailyScore", "clubId"]
+        ),
+        lambda: get_activities_by_club(club_id, active_only=True, projection=["activityId", "name"]),
+    )
     club_tracking = [t for t in tracking_records if t.get("clubId") == club_id]
     
-    # Get activities (club-wide + team-specific)
-    club_activities = get_activities_by_club(club_id, active_only=True)
     activity_map = {a.get("activityId"): a.get("name") for a in club_activities}
     
+    # Fetch every player in the export with one batched read
+    players = get_players_by_ids(
+        [record.get("playerId") for record in club_tracking],
+        projection=["firstName", "lastName", "name"],
+    )
+    
     # Aggregate by player
     player_data = {}
     for record in club_tracking:
@@ -4198,7 +4223,7 @@ def export_week(week_id):
         daily_score = record.get("dailyScore", 0)
         
         if player_id not in player_data:
-            player = get_player_by_id(player_id)
+            player = players.get(player_id)
             if player:
                 first_name = player.get("firstName", "")
                 last_name = player.get("lastName", "")
@@ -4308,6 +4333,7 @@ def advance_week():
                 },
                 ReturnValues="ALL_NEW",
             )
+            invalidate_team(team_id)
             updated_teams.append(team_id)
         except Exception as e:
             print(f"Error updating team {team_id}: {e}")
@@ -4366,11 +4392,15 @@ def list_reflections():
         )
         reflections = response.get("Items", [])
     
-    # Get player details for each reflection
+    # Get player details for all reflections with one batched read
+    players = get_players_by_ids(
+        [reflection.get("playerId") for reflection in reflections],
+        projection=["firstName", "lastName", "name", "isActive"],
+    )
     reflections_with_players = []
     for reflection in reflections:
         player_id = reflection.get("playerId")
-        player = get_player_by_id(player_id)
+        player = players.get(player_id)
         
         if player and player.get("isActive", True):
             first_name = player.get("firstName", "")
@@ -17,14 +17,18 @@ from shared.db_utils import (
     get_activities_by_team,
     get_activities_by_club,
     get_tracking_by_player_week,
-    get_tracking_by_week,
+    iter_tracking_by_week,
     get_reflection_by_player_week,
     create_tracking_record,
     create_or_update_reflection,
     get_content_pages_by_team,
     get_content_pages_by_club,
-    get_player_by_id,
+    get_content_page_by_slug,
+    get_content_page_by_id,
+    CONTENT_PAGE_SUMMARY_FIELDS,
+    get_players_by_ids,
     get_team_by_id,
+    batch_reads,
 )
 from shared.week_utils import get_current_week_id, get_week_id, get_week_dates
 
@@ -219,11 +223,13 @@ def get_player_by_jwt():
         player_id = player.get("playerId")
         current_week_id = get_current_week_id()
         
-        # Get club-wide activities
-        club_activities = get_activities_by_club(club_id, active_only=True)
-        
-        # Get team-specific activities
-        team_activities = get_activities_by_team(team_id, active_only=True)
+        # Fetch club-wide activities, team-specific activities and the week's
+        # tracking concurrently - the reads are independent
+        club_activities, team_activities, tracking_records = batch_reads(
+            lambda: get_activities_by_club(club_id, active_only=True),
+            lambda: get_activities_by_team(team_id, active_only=True),
+            lambda: get_tracking_by_player_week(player_id, current_week_id),
+        )
         
         # Combine activities and deduplicate by activityId
         activity_map = {}
@@ -236,9 +242,6 @@ def get_player_by_jwt():
         # Sort by displayOrder
         activities.sort(key=lambda x: x.get("displayOrder", 999))
         
-        # Get tracking data for current week
-        tracking_records = get_tracking_by_player_week(player_id, current_week_id)
-        
         # Build daily tracking map
         daily_tracking = {}
         for record in tracking_records:
@@ -301,11 +304,14 @@ def get_week_by_jwt(week_id):
         team_id = player.get("teamId")
         player_id = player.get("playerId")
         
-        # Get club-wide activities
-        club_activities = get_activities_by_club(club_id, active_only=True)
-        
-        # Get team-specific activities
-        team_activities = get_activities_by_team(team_id, active_only=True)
+        # Fetch club-wide activities, team-specific activities and the week's
+        # tracking and reflection concurrently - the reads are independent
+        club_activities, team_activities, tracking_records, reflection = batch_reads(
+            lambda: get_activities_by_club(club_id, active_only=True),
+            lambda: get_activities_by_team(team_id, active_only=True),
+            lambda: get_tracking_by_player_week(player_id, week_id),
+            lambda: get_reflection_by_player_week(player_id, week_id),
+        )
         
         # Combine activities and deduplicate by activityId
         activity_map = {}
@@ -318,9 +324,6 @@ def get_week_by_jwt(week_id):
         # Sort by displayOrder
         activities.sort(key=lambda x: x.get("displayOrder", 999))
         
-        # Get tracking data for the week
-        tracking_records = get_tracking_by_player_week(player_id, week_id)
-        
         # Build daily tracking map
         daily_tracking = {}
         for record in tracking_records:
@@ -333,9 +336,6 @@ def get_week_by_jwt(week_id):
         # Calculate weekly score
         weekly_score = sum(record.get("dailyScore", 0) for record in tracking_records)
         
-        # Get reflection for the week
-        reflection = get_reflection_by_player_week(player_id, week_id)
-        
         # Build response
         response_data = {
             "weekId": week_id,
@@ -375,16 +375,15 @@ def get_progress_by_jwt():
         player_id = player.get("playerId")
         current_week_id = get_current_week_id()
         
-        # Get last 4 weeks of data
+        # Get last 4 weeks of data (tracking for each week is fetched concurrently)
         weeks_data = []
         current_date = datetime.utcnow()
+        week_ids = [get_week_id(current_date - timedelta(weeks=i)) for i in range(4)]
+        weekly_tracking = batch_reads(
+            *(lambda wid=wid: get_tracking_by_player_week(player_id, wid) for wid in week_ids)
+        )
         
-        for i in range(4):
-            week_date = current_date - timedelta(weeks=i)
-            week_id = get_week_id(week_date)
-            
-            tracking_records = get_tracking_by_player_week(player_id, week_id)
-            
+        for week_id, tracking_records in zip(week_ids, weekly_tracking):
             # Calculate stats for this week
             weekly_score = sum(record.get("dailyScore", 0) for record in tracking_records)
             days_completed = len(tracking_records)
@@ -624,11 +623,13 @@ def get_player(unique_link):
     if not team.get("isActive", True):
         return flask_error_response("Team is inactive", status_code=403)
     
-    # Get club-wide activities
-    club_activities = get_activities_by_club(club_id, active_only=True)
-    
-    # Get team-specific activities
-    team_activities = get_activities_by_team(team_id, active_only=True)
+    # Fetch club-wide activities, team-specific activities and the week's
+    # tracking concurrently - the reads are independent
+    club_activities, team_activities, tracking_records = batch_reads(
+        lambda: get_activities_by_club(club_id, active_only=True),
+        lambda: get_activities_by_team(team_id, active_only=True),
+        lambda: get_tracking_by_player_week(player_id, current_week_id),
+    )
     
     # Combine activities and deduplicate by activityId
     activity_map = {}
@@ -641,9 +642,6 @@ def get_player(unique_link):
     # Sort by displayOrder
     activities.sort(key=lambda x: x.get("displayOrder", 999))
     
-    # Get tracking data for current week
-    tracking_records = get_tracking_by_player_week(player_id, current_week_id)
-    
     # Build daily tracking map
     daily_tracking = {}
     for record in tracking_records:
@@ -716,11 +714,14 @@ def get_week(unique_link, week_id):
     if not team.get("isActive", True):
         return flask_error_response("Team is inactive", status_code=403)
     
-    # Get club-wide activities
-    club_activities = get_activities_by_club(club_id, active_only=True)
-    
-    # Get team-specific activities
-    team_activities = get_activities_by_team(team_id, active_only=True)
+    # Fetch club-wide activities, team-specific activities and the week's
+    # tracking and reflection concurrently - the reads are independent
+    club_activities, team_activities, tracking_records, reflection = batch_reads(
+        lambda: get_activities_by_club(club_id, active_only=True),
+        lambda: get_activities_by_team(team_id, active_only=True),
+        lambda: get_tracking_by_player_week(player_id, week_id),
+        lambda: get_reflection_by_player_week(player_id, week_id),
+    )
     
     # Combine activities and deduplicate by activityId
     activity_map = {}
@@ -733,9 +734,6 @@ def get_week(unique_link, week_id):
     # Sort by displayOrder
     activities.sort(key=lambda x: x.get("displayOrder", 999))
     
-    # Get tracking data for the week
-    tracking_records = get_tracking_by_player_week(player_id, week_id)
-    
     # Build daily tracking map
     daily_tracking = {}
     for record in tracking_records:
@@ -748,9 +746,6 @@ def get_week(unique_link, week_id):
     # Calculate weekly score
     weekly_score = sum(record.get("dailyScore", 0) for record in tracking_records)
     
-    # Get reflection for the week
-    reflection = get_reflection_by_player_week(player_id, week_id)
-    
     # Build response
     response_data = {
         "weekId": week_id,
@@ -792,16 +787,15 @@ def get_progress(unique_link):
     if not club_id or not team_id:
         return flask_error_response("Player missing clubId or teamId", status_code=500)
     
-    # Get last 4 weeks of data
+    # Get last 4 weeks of data (tracking for each week is fetched concurrently)
     weeks_data = []
     current_date = datetime.utcnow()
+    week_ids = [get_week_id(current_date - timedelta(weeks=i)) for i in range(4)]
+    weekly_tracking = batch_reads(
+        *(lambda wid=wid: get_tracking_by_player_week(player_id, wid) for wid in week_ids)
+    )
     
-    for i in range(4):
-        week_date = current_date - timedelta(weeks=i)
-        week_id = get_week_id(week_date)
-        
-        tracking_records = get_tracking_by_player_week(player_id, week_id)
-        
+    for week_id, tracking_records in zip(week_ids, weekly_tracking):
         # Calculate stats for this week
         weekly_score = sum(record.get("dailyScore", 0) for record in tracking_records)
         days_completed = len(tracking_records)
@@ -1044,22 +1038,24 @@ def get_leaderboard(week_id):
             club_id = player.get("clubId")
             team_id = player.get("teamId")
     
-    # Get all tracking records for the week
-    tracking_records = get_tracking_by_week(week_id)
+    # Stream the week's tracking records page by page
+    tracking_records = iter_tracking_by_week(
+        week_id, projection=["playerId", "dailyScore", "clubId", "teamId"]
+    )
     
     # Filter by scope if player context is available
     if scope == "club" and club_id:
         # Filter to players in same club
-        filtered_records = [
+        filtered_records = (
             r for r in tracking_records 
             if r.get("clubId") == club_id
-        ]
+        )
     elif scope == "team" and team_id:
         # Filter to players in same team
-        filtered_records = [
+        filtered_records = (
             r for r in tracking_records 
             if r.get("teamId") == team_id
-        ]
+        )
     else:
         # No filtering (show all) if no context or invalid scope
         filtered_records = tracking_records
@@ -1082,10 +1078,13 @@ def get_leaderboard(week_id):
         player_scores[player_id]["weeklyScore"] += daily_score
         player_scores[player_id]["daysCompleted"] += 1
     
-    # Get player details and build leaderboard
+    # Get player details (one batched read) and build leaderboard
+    players = get_players_by_ids(
+        list(player_scores), projection=["firstName", "lastName", "isActive"]
+    )
     leaderboard = []
     for player_id, score_data in player_scores.items():
-        player = get_player_by_id(player_id)
+        player = players.get(player_id)
         if player and player.get("isActive", True):
             leaderboard.append({
                 "playerId": player_id,
@@ -1140,11 +1139,12 @@ def list_content():
     if not club_id or not team_id:
         return flask_error_response("Missing or invalid uniqueLink parameter", status_code=400)
     
-    # Get club-wide content pages
-    club_content = get_content_pages_by_club(club_id, published_only=True)
-    
-    # Get team-specific content pages
-    team_content = get_content_pages_by_team(team_id, published_only=True)
+    # Get club-wide and team-specific content pages concurrently
+    # (list view never needs htmlContent)
+    club_content, team_content = batch_reads(
+        lambda: get_content_pages_by_club(club_id, published_only=True, projection=CONTENT_PAGE_SUMMARY_FIELDS),
+        lambda: get_content_pages_by_team(team_id, published_only=True, projection=CONTENT_PAGE_SUMMARY_FIELDS),
+    )
     
     # Combine content and deduplicate by pageId
     content_map = {}
@@ -1204,26 +1204,23 @@ def get_content(slug):
     if not club_id or not team_id:
         return flask_error_response("Missing or invalid uniqueLink parameter", status_code=400)
     
-    # Get club-wide content pages
-    club_content = get_content_pages_by_club(club_id, published_only=False)
-    
-    # Get team-specific content pages
-    team_content = get_content_pages_by_team(team_id, published_only=False)
-    
-    # Search for content page by slug in both club and team content
-    content_page = None
-    for page in club_content + team_content:
-        if page.get("slug") == slug:
-            # Validate content belongs to player's club
-            page_club_id = page.get("clubId")
-            if page_club_id != club_id:
-                continue
-            # If team-specific, validate it belongs to player's team
-            page_team_id = page.get("teamId")
-            if page_team_id and page_team_id != team_id:
-                continue
-            content_page = page
-            break
+    # Team pages resolve directly through the teamId-slug-index. Club-wide
+    # pages have no teamId, so they are only searched (by slug, without their
+    # htmlContent) when the team has no page with this slug.
+    content_page = get_content_page_by_slug(team_id, slug)
+    if content_page is None:
+        club_pages = get_content_pages_by_club(club_id, published_only=False, projection=["pageId", "slug"])
+        match = next((page for page in club_pages if page.get("slug") == slug), None)
+        if match:
+            content_page = get_content_page_by_id(match["pageId"])
+    
+    if content_page:
+        # Validate content belongs to player's club
+        page_club_id = content_page.get("clubId")
+        # If team-specific, validate it belongs to player's team
+        page_team_id = content_page.get("teamId")
+        if page_club_id != club_id or (page_team_id and page_team_id != team_id):
+            content_page = None
     
     if not content_page:
         return flask_error_response("Content page not found", status_code=404)
@@ -3,9 +3,14 @@ Authentication and authorization utilities for Lambda functions.
 """
 
 import os
+import re
 import json
+import time
 import base64
-from typing import Dict, Any, Optional, List
+import hashlib
+import logging
+from typing import Dict, Any, Optional, List, Tuple
+import urllib3
 from botocore.exceptions import ClientError
 
 try:
@@ -18,9 +23,32 @@ except ImportError:
     jwk = None
     boto3 = None
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
+
 # Cognito configuration (will be set via environment variables)
 COGNITO_USER_POOL_ID = os.environ.get("COGNITO_USER_POOL_ID")
 COGNITO_REGION = os.environ.get("COGNITO_REGION", "us-east-2")
+_COGNITO_ISSUER = (
+    f"https://cognito-idp.{COGNITO_REGION}.amazonaws.com/{COGNITO_USER_POOL_ID}"
+    if COGNITO_USER_POOL_ID else None
+)
+
+# Signing keys rotate rarely; keep the JWKS for the life of a warm container,
+# refreshing after this many seconds.
+JWKS_CACHE_TTL_SECONDS = 3600
+_jwks_cache: Dict[str, Any] = {"keys": None, "expires_at": 0.0}
+
+# Pooled HTTP client for JWKS fetches (urllib3 ships with botocore), so a
+# refresh reuses the TLS connection instead of handshaking every time.
+_HTTP = urllib3.PoolManager(num_pools=2, maxsize=4, timeout=2.0)
+
+# User info decoded from Bearer tokens by extract_user_info_from_jwt_token,
+# keyed by a digest of the token so raw tokens are not kept in memory. A
+# client repeats the same token on every request until it is refreshed.
+TOKEN_CACHE_TTL_SECONDS = 30
+_TOKEN_CACHE_MAX_ENTRIES = 1024
+_token_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 # Admin group names
 APP_ADMIN_GROUP_NAME = "app-admin"  # Platform-wide admins (can create clubs)
@@ -28,6 +56,13 @@ APP_ADMIN_GROUP_NAME = "app-admin"  # Platform-wide admins (can create clubs)
 # - club-{clubName}-admins: Created when app-admin creates a club (uses sanitized club name)
 # - coach-{clubId}-{teamId}: Created when club-admin creates a team
 
+# Any group that grants admin access other than app-admin:
+# club-{sanitizedName}-admins or coach-{clubId}-{teamId}
+_ADMIN_GROUP_RE = re.compile(r'^(?:club-[a-z0-9_-]+-admins|coach-[a-f0-9-]+-[a-f0-9-]+)$')
+# coach-{clubId}-{teamId} and club-{sanitizedName}-admins, with the IDs/name captured
+_COACH_GROUP_RE = re.compile(r'^coach-([a-f0-9-]+)-([a-f0-9-]+)$')
+_CLUB_ADMIN_GROUP_RE = re.compile(r'^club-([a-z0-9_-]+)-admins$')
+
 
 def get_cognito_public_keys(user_pool_id: str, region: str) -> Dict[str, Any]:
     """
@@ -40,26 +75,82 @@ def get_cognito_public_keys(user_pool_id: str, region: str) -> Dict[str, Any]:
     Returns:
         Dictionary of public keys
     """
-    if not boto3:
-        return {}
-
     try:
-        cognito_client = boto3.client("cognito-idp", region_name=region)
-        response = cognito_client.describe_user_pool(UserPoolId=user_pool_id)
         issuer = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}"
         
         # Get JWKS from well-known endpoint
-        import urllib.request
         jwks_url = f"{issuer}/.well-known/jwks.json"
-        with urllib.request.urlopen(jwks_url) as response:
-            jwks = json.loads(response.read())
+        response = _HTTP.request("GET", jwks_url)
+        if response.status != 200:
+            raise RuntimeError(f"JWKS endpoint returned HTTP {response.status}")
+        jwks = json.loads(response.data)
         
         return jwks
     except Exception as e:
-        print(f"Error getting Cognito public keys: {e}")
+        logger.error("Error getting Cognito public keys: %s", e)
         return {}
 
 
+def get_cognito_public_keys_cached() -> Dict[str, Any]:
+    """
+    Get the configured user pool's public keys, cached per warm container.
+
+    Uses COGNITO_USER_POOL_ID/COGNITO_REGION from the environment. Failed
+    fetches are not cached, so the next call retries.
+
+    Returns:
+        Dictionary of public keys, or {} if the pool is not configured or
+        the fetch failed
+    """
+    if not _COGNITO_ISSUER:
+        return {}
+
+    now = time.monotonic()
+    if _jwks_cache["keys"] is not None and now < _jwks_cache["expires_at"]:
+        return _jwks_cache["keys"]
+
+    jwks = get_cognito_public_keys(COGNITO_USER_POOL_ID, COGNITO_REGION)
+    if jwks:
+        _jwks_cache["keys"] = jwks
+        _jwks_cache["expires_at"] = now + JWKS_CACHE_TTL_SECONDS
+    return jwks
+
+
+def normalize_groups(groups_raw: Any) -> List[str]:
+    """
+    Normalize a cognito:groups claim to a list of group names.
+
+    API Gateway passes groups as a list, but some paths deliver them as a
+    comma-separated string.
+
+    Args:
+        groups_raw: Raw claim value (list, comma-separated string, or None)
+
+    Returns:
+        List of group names
+    """
+    if type(groups_raw) is list:
+        return groups_raw
+    if isinstance(groups_raw, str):
+        return [g.strip() for g in groups_raw.split(",") if g.strip()]
+    return []
+
+
+# Key under which extract_user_info_from_event memoizes its result on the event.
+# A stored False means "no claims", so unauthenticated events are not re-parsed.
+_USER_INFO_CACHE_KEY = "__user_info_cache"
+
+
+def clear_user_info_cache(event: Dict[str, Any]) -> None:
+    """
+    Drop the memoized user info from an event after its claims were modified.
+
+    Args:
+        event: API Gateway Lambda event
+    """
+    event.pop(_USER_INFO_CACHE_KEY, None)
+
+
 def extract_user_info_from_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Extract user information from API Gateway event (Cognito authorizer context).
@@ -70,6 +161,10 @@ def extract_user_info_from_event(event: Dict[str, Any]) -> Optional[Dict[str, An
     Returns:
         Dictionary with user info (username, email, groups) or None if not authenticated
     """
+    cached = event.get(_USER_INFO_CACHE_KEY)
+    if cached is not None:
+        return cached or None
+    
     # Check for Cognito authorizer context
     request_context = event.get("requestContext", {})
     authorizer = request_context.get("authorizer", {})
@@ -78,18 +173,12 @@ def extract_user_info_from_event(event: Dict[str, Any]) -> Optional[Dict[str, An
     claims = authorizer.get("claims", {})
     
     if not claims:
+        event[_USER_INFO_CACHE_KEY] = False
         return None
     
     # Extract user information from JWT claims
     # Handle groups - can be a list or a string (comma-separated)
-    groups_raw = claims.get("cognito:groups", [])
-    if isinstance(groups_raw, str):
-        # If groups is a string, split by comma and strip whitespace
-        groups = [g.strip() for g in groups_raw.split(",") if g.strip()]
-    elif isinstance(groups_raw, list):
-        groups = groups_raw
-    else:
-        groups = []
+    groups = normalize_groups(claims.get("cognito:groups"))
     
     user_info = {
         "username": claims.get("cognito:username") or claims.get("sub"),
@@ -100,6 +189,7 @@ def extract_user_info_from_event(event: Dict[str, Any]) -> Optional[Dict[str, An
         "custom:teamIds": claims.get("custom:teamIds"),
     }
     
+    event[_USER_INFO_CACHE_KEY] = user_info
     return user_info
 
 
@@ -117,30 +207,41 @@ def extract_user_info_from_jwt_token(token: str) -> Optional[Dict[str, Any]]:
         Dictionary with user info (username, email, groups) or None if token is invalid
     """
     if not token:
-        print(f"DEBUG extract_user_info_from_jwt_token: No token provided")
+        logger.debug("extract_user_info_from_jwt_token: No token provided")
         return None
     
     if not jwt:
-        print(f"DEBUG extract_user_info_from_jwt_token: JWT library not available")
+        logger.debug("extract_user_info_from_jwt_token: JWT library not available")
         return None
     
+    cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+    now = time.monotonic()
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    user_info = _decode_user_info_from_jwt_token(token)
+    if user_info is not None:
+        _token_cache.pop(cache_key, None)
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[cache_key] = (now + TOKEN_CACHE_TTL_SECONDS, user_info)
+    return user_info
+
+
+def _decode_user_info_from_jwt_token(token: str) -> Optional[Dict[str, Any]]:
+    """Decode a JWT (without verification) into a user info dict, or None if invalid."""
     try:
-        print(f"DEBUG extract_user_info_from_jwt_token: Attempting to decode token (length: {len(token)})")
+        logger.debug("extract_user_info_from_jwt_token: Attempting to decode token (length: %d)", len(token))
         # Decode without verification (since API Gateway would have verified it if authorizer was used)
         # In production, you should verify the signature using Cognito public keys
         decoded = jwt.get_unverified_claims(token)
-        print(f"DEBUG extract_user_info_from_jwt_token: Successfully decoded token. Keys: {list(decoded.keys())[:10]}")
+        logger.debug("extract_user_info_from_jwt_token: Successfully decoded token with %d claims", len(decoded))
         
         # Extract user information from JWT claims
         # Handle groups - can be a list or a string (comma-separated)
-        groups_raw = decoded.get("cognito:groups", [])
-        if isinstance(groups_raw, str):
-            # If groups is a string, split by comma and strip whitespace
-            groups = [g.strip() for g in groups_raw.split(",") if g.strip()]
-        elif isinstance(groups_raw, list):
-            groups = groups_raw
-        else:
-            groups = []
+        groups = normalize_groups(decoded.get("cognito:groups"))
         
         user_info = {
             "username": decoded.get("cognito:username") or decoded.get("sub"),
@@ -151,12 +252,13 @@ def extract_user_info_from_jwt_token(token: str) -> Optional[Dict[str, Any]]:
             "custom:teamIds": decoded.get("custom:teamIds"),
         }
         
-        print(f"DEBUG extract_user_info_from_jwt_token: Extracted user info - email: {user_info.get('email')}, username: {user_info.get('username')}, groups: {groups}, clubId: {user_info.get('custom:clubId')}")
+        logger.debug(
+            "extract_user_info_from_jwt_token: Extracted user info - email: %s, username: %s, groups: %s, clubId: %s",
+            user_info["email"], user_info["username"], groups, user_info["custom:clubId"],
+        )
         return user_info
     except Exception as e:
-        import traceback
-        print(f"ERROR extract_user_info_from_jwt_token: Failed to decode token: {e}")
-        traceback.print_exc()
+        logger.error("extract_user_info_from_jwt_token: Failed to decode token: %s", e, exc_info=True)
         return None
 
 
@@ -180,51 +282,37 @@ def verify_app_admin_role(event: Dict[str, Any]) -> bool:
     return APP_ADMIN_GROUP_NAME in groups
 
 
-def verify_admin_role(event: Dict[str, Any]) -> bool:
+def _verify_admin_role(user_info: Dict[str, Any]) -> bool:
     """
-    Verify that the authenticated user has admin role (app-admin, club-admin, or coach).
+    Check an already-extracted user info dict for an admin group.
 
     Args:
-        event: API Gateway Lambda event
+        user_info: User info as returned by extract_user_info_from_event
 
     Returns:
         True if user is app-admin, club-{clubName}-admins, or coach-{clubId}-{teamId}, False otherwise
     """
-    import re
-    
-    user_info = extract_user_info_from_event(event)
-    
-    if not user_info:
-        print("DEBUG verify_admin_role: No user_info from event")
-        return False
-    
     groups = user_info.get("groups", [])
-    print(f"DEBUG verify_admin_role: Checking groups: {groups}")
     
     # Check for app-admin (exact match)
     if APP_ADMIN_GROUP_NAME in groups:
-        print(f"DEBUG verify_admin_role: Found app-admin group")
         return True
     
-    # Check for club-{clubName}-admins pattern (new format with sanitized club name)
-    # Matches: club-{alphanumeric, underscores, hyphens}-admins
-    club_admin_pattern = re.compile(r'^club-([a-z0-9_-]+)-admins$')
-    for group in groups:
-        print(f"DEBUG verify_admin_role: Checking group '{group}' against club-admin pattern")
-        if club_admin_pattern.match(group):
-            print(f"DEBUG verify_admin_role: Group '{group}' matches club-admin pattern")
-            return True
-    
-    # Check for coach-{clubId}-{teamId} pattern
-    coach_pattern = re.compile(r'^coach-([a-f0-9-]+)-([a-f0-9-]+)$')
-    for group in groups:
-        print(f"DEBUG verify_admin_role: Checking group '{group}' against coach pattern")
-        if coach_pattern.match(group):
-            print(f"DEBUG verify_admin_role: Group '{group}' matches coach pattern")
-            return True
-    
-    print(f"DEBUG verify_admin_role: No matching admin groups found")
-    return False
+    # Check for club-{clubName}-admins or coach-{clubId}-{teamId} in one pass
+    return any(_ADMIN_GROUP_RE.match(group) for group in groups)
+
+
+def verify_admin_role(event: Dict[str, Any]) -> bool:
+    """
+    Verify that the authenticated user has admin role (app-admin, club-admin, or coach).
+
+    Args:
+        event: API Gateway Lambda event
+
+    Returns:
+        True if user is app-admin, club-{clubName}-admins, or coach-{clubId}-{teamId}, False otherwise
+    """
+    return _verify_admin_role(extract_user_info_from_event(event) or {})
 
 
 def require_admin(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -245,7 +333,7 @@ def require_admin(event: Dict[str, Any]) -> Dict[str, Any]:
     if not user_info:
         raise Exception("Authentication required")
     
-    if not verify_admin_role(event):
+    if not _verify_admin_role(user_info):
         raise Exception("Admin access required")
     
     return user_info
@@ -261,40 +349,38 @@ def get_club_id_from_user(event: Dict[str, Any]) -> Optional[str]:
     Returns:
         clubId or None
     """
-    import re
-    
     request_context = event.get("requestContext", {})
     authorizer = request_context.get("authorizer", {})
     claims = authorizer.get("claims", {})
     
     if not claims:
-        print("DEBUG get_club_id_from_user: No claims in event")
+        logger.debug("get_club_id_from_user: No claims in event")
         return None
     
     # Try custom:clubId attribute first (preferred)
     club_id = claims.get("custom:clubId")
     if club_id:
-        print(f"DEBUG get_club_id_from_user: Found clubId from custom:clubId attribute: {club_id}")
+        logger.debug("get_club_id_from_user: Found clubId from custom:clubId attribute: %s", club_id)
         return club_id
     
-    print(f"DEBUG get_club_id_from_user: No custom:clubId in claims, trying group lookup")
+    logger.debug("get_club_id_from_user: No custom:clubId in claims, trying group lookup")
     
     # Try extracting from group names using pattern matching
     user_info = extract_user_info_from_event(event)
     if user_info:
         groups = user_info.get("groups", [])
         
-        # Pattern for coach-{clubId}-{teamId} (extract clubId)
-        coach_pattern = re.compile(r'^coach-([a-f0-9-]+)-([a-f0-9-]+)$')
-        for group in groups:
-            match = coach_pattern.match(group)
-            if match:
-                return match.group(1)  # Return clubId from coach group
+        # Pattern for coach-{clubId}-{teamId} (extract clubId from the first match)
+        club_id = next(
+            (match.group(1) for group in groups if (match := _COACH_GROUP_RE.match(group))),
+            None,
+        )
+        if club_id:
+            return club_id
         
         # Pattern for club-{sanitizedName}-admins (need to look up club by name)
-        club_admin_pattern = re.compile(r'^club-([a-z0-9_-]+)-admins$')
         for group in groups:
-            match = club_admin_pattern.match(group)
+            match = _CLUB_ADMIN_GROUP_RE.match(group)
             if match:
                 sanitized_name = match.group(1)
                 # Look up club by matching sanitized name
@@ -331,15 +417,16 @@ def get_club_id_from_user(event: Dict[str, Any]) -> Optional[str]:
                             if club_sanitized == sanitized_name:
                                 club_id = club.get("clubId")
                                 if club_id:
-                                    print(f"DEBUG get_club_id_from_user: Found club {club_id} by matching sanitized name '{sanitized_name}'")
+                                    logger.debug("get_club_id_from_user: Found club %s by matching sanitized name '%s'", club_id, sanitized_name)
                                     return club_id
                 except Exception as e:
-                    import traceback
-                    print(f"ERROR get_club_id_from_user: Could not look up club by sanitized name '{sanitized_name}': {e}")
-                    traceback.print_exc()
+                    logger.error(
+                        "get_club_id_from_user: Could not look up club by sanitized name '%s': %s",
+                        sanitized_name, e, exc_info=True,
+                    )
                     # Continue to return None if lookup fails
     
-    print(f"DEBUG get_club_id_from_user: Could not extract clubId from user")
+    logger.debug("get_club_id_from_user: Could not extract clubId from user")
     return None
 
 
@@ -353,8 +440,6 @@ def get_team_ids_from_user(event: Dict[str, Any]) -> List[str]:
     Returns:
         List of teamIds user has access to
     """
-    import re
-    
     request_context = event.get("requestContext", {})
     authorizer = request_context.get("authorizer", {})
     claims = authorizer.get("claims", {})
@@ -375,12 +460,13 @@ def get_team_ids_from_user(event: Dict[str, Any]) -> List[str]:
     
     groups = user_info.get("groups", [])
     team_ids = []
-    coach_pattern = re.compile(r'^coach-([a-f0-9-]+)-([a-f0-9-]+)$')
+    seen = set()
     for group in groups:
-        match = coach_pattern.match(group)
+        match = _COACH_GROUP_RE.match(group)
         if match:
             team_id = match.group(2)  # Extract teamId from coach group
-            if team_id not in team_ids:
+            if team_id not in seen:
+                seen.add(team_id)
                 team_ids.append(team_id)
     
     return team_ids
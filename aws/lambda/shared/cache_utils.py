@@ -0,0 +1,94 @@
+"""
+In-memory caching utilities for Lambda functions.
+
+Module-level state survives across invocations while an execution environment
+stays warm, so a short-lived cache turns repeated lookups of slowly changing
+records into dict hits. Entries expire after a fixed TTL, which bounds how long
+a container can serve data that another container has since changed.
+"""
+
+import time
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Convert list/dict arguments into hashable equivalents for cache keys."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Build a cache key from call arguments."""
+    key = _freeze(args)
+    if kwargs:
+        key += (_freeze(kwargs),)
+    return key
+
+
+def ttl_cache(
+    seconds: float, maxsize: int = 256, cache_if: Optional[Callable[[Any], bool]] = None
+) -> Callable:
+    """
+    Cache a function's results in memory for a fixed number of seconds.
+
+    None results are not cached, so "not found" and error paths are retried on
+    the next call; cache_if can exclude other short-lived results the same way.
+    The decorated function gains:
+        cache_clear(): drop every entry
+        invalidate(*args, **kwargs): drop the entry for one set of arguments
+
+    Usage:
+        @ttl_cache(seconds=60)
+        def get_club_by_id(club_id):
+            ...
+
+    Args:
+        seconds: Time-to-live for each entry
+        maxsize: Maximum number of entries; the oldest entry is evicted first
+        cache_if: Optional predicate; results for which it returns False are
+            returned but not cached
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        # Guards writes; callers may run lookups concurrently via batch_reads
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(*args, **kwargs)
+            if value is not None and (cache_if is None or cache_if(value)):
+                with lock:
+                    cache.pop(key, None)
+                    if len(cache) >= maxsize:
+                        # Dicts keep insertion order, so the first key is the oldest
+                        cache.pop(next(iter(cache)))
+                    cache[key] = (now + seconds, value)
+            return value
+
+        def invalidate(*args, **kwargs) -> None:
+            with lock:
+                cache.pop(_make_key(args, kwargs), None)
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -3,9 +3,20 @@ DynamoDB helper utilities for Lambda functions.
 """
 
 import os
+import time
+import logging
+import threading
 import boto3
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, Callable
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from shared.cache_utils import ttl_cache
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
 
 # DynamoDB table names (must match database_stack.py)
 PLAYER_TABLE = os.environ.get("PLAYER_TABLE", "ConsistencyTracker-Players")
@@ -18,112 +29,448 @@ CLUB_TABLE = os.environ.get("CLUB_TABLE", "ConsistencyTracker-Clubs")
 COACH_TABLE = os.environ.get("COACH_TABLE", "ConsistencyTracker-Coaches")
 CLUB_ADMIN_TABLE = os.environ.get("CLUB_ADMIN_TABLE", "ConsistencyTracker-ClubAdmins")
 EMAIL_VERIFICATION_TABLE = os.environ.get("EMAIL_VERIFICATION_TABLE", "ConsistencyTracker-EmailVerifications")
+EMAIL_VERIFICATION_STATE_TABLE = os.environ.get("EMAIL_VERIFICATION_STATE_TABLE", "ConsistencyTracker-EmailVerificationState")
 VERIFICATION_ATTEMPTS_TABLE = os.environ.get("VERIFICATION_ATTEMPTS_TABLE", "ConsistencyTracker-VerificationAttempts")
 RESEND_TRACKING_TABLE = os.environ.get("RESEND_TRACKING_TABLE", "ConsistencyTracker-ResendTracking")
 
+# Keep pooled connections alive between invocations, and allow enough of them
+# for the batch_reads executor to run its reads without queueing for a socket.
+_BOTO_CONFIG = Config(tcp_keepalive=True, max_pool_connections=50)
+
 # Initialize DynamoDB client
-dynamodb = boto3.resource("dynamodb")
+dynamodb = boto3.resource("dynamodb", config=_BOTO_CONFIG)
+_TABLE_CACHE: Dict[str, Any] = {}
+
+# Low-level client for the hottest point reads (see _get_item). The resource's
+# own meta.client has the marshalling hooks registered, so keep a separate one.
+_client = boto3.client("dynamodb", config=_BOTO_CONFIG)
+_deserializer = TypeDeserializer()
+
+# Optional DynamoDB Accelerator (DAX) cluster. When DAX_ENDPOINT is set, table
+# reads and writes go through the cluster's write-through item cache instead
+# of DynamoDB directly. The function must run in the cluster's VPC and the
+# amazon-dax-client package must be in the layer; otherwise DynamoDB is used.
+DAX_ENDPOINT = os.environ.get("DAX_ENDPOINT")
+if DAX_ENDPOINT:
+    try:
+        from amazondax import AmazonDaxClient
+        dynamodb = AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT)
+        _client = AmazonDaxClient(endpoint_url=DAX_ENDPOINT)
+    except ImportError:
+        logger.warning("DAX_ENDPOINT is set but amazondax is not installed; using DynamoDB directly")
+
+# Point lookups of slowly changing records are cached per warm container for
+# this long; writes through this container invalidate immediately, writes from
+# other containers are picked up once the entry expires.
+LOOKUP_CACHE_TTL_SECONDS = 60
+
+# BatchGetItem accepts at most 100 keys per request
+_BATCH_GET_MAX_KEYS = 100
+_BATCH_GET_MAX_RETRIES = 5
+
+# Shared pool for overlapping independent reads (see batch_reads). Threads are
+# started lazily and reused across warm invocations.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Server-side FilterExpression fragments shared by the query helpers below.
+# DynamoDB drops non-matching items before returning the page, so inactive,
+# unpublished or team-scoped rows never cross the wire.
+_ACTIVE_FILTER = "(attribute_not_exists(isActive) OR isActive <> :false)"
+_PUBLISHED_FILTER = "isPublished = :true"
+# teamId is a GSI key, so DynamoDB never stores it as NULL or "" - club-wide
+# rows simply omit the attribute.
+_CLUB_WIDE_FILTER = "attribute_not_exists(teamId)"
+
+# User type -> (table name, partition key) for the user tables that carry a
+# verificationStatus
+_USER_TABLES = {
+    "player": (PLAYER_TABLE, "playerId"),
+    "coach": (COACH_TABLE, "coachId"),
+    "club_admin": (CLUB_ADMIN_TABLE, "adminId"),
+}
+
+_VERIFICATION_UPDATE_EXPRESSION = "SET verificationStatus = :status, updatedAt = :updatedAt"
+
+# Content page attributes needed by list views and slug checks - everything
+# except the (potentially large) htmlContent body.
+CONTENT_PAGE_SUMMARY_FIELDS = [
+    "pageId", "slug", "title", "category", "scope", "isPublished", "displayOrder",
+    "clubId", "teamId", "createdAt", "updatedAt", "createdBy", "lastEditedBy",
+]
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO-8601 string with a trailing "Z".
+
+    Uses a timezone-aware datetime (utcnow() is deprecated) and always
+    includes microseconds, so stored timestamps have a fixed width and sort
+    lexicographically.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
 def get_table(table_name: str):
-    """Get a DynamoDB table resource."""
-    return dynamodb.Table(table_name)
+    """Get a DynamoDB table resource (one resource object per table name)."""
+    table = _TABLE_CACHE.get(table_name)
+    if table is None:
+        table = _TABLE_CACHE[table_name] = dynamodb.Table(table_name)
+    return table
+
+
+def get_client():
+    """
+    Get the low-level DynamoDB client (DAX when configured).
+
+    For hot paths on small fixed-schema items: keys, items and values are
+    passed and returned in DynamoDB's typed JSON ({"S": ...}, {"N": ...}),
+    which skips the resource layer's per-call marshalling.
+    """
+    return _client
+
+
+def _warm_up() -> None:
+    """
+    Build the Table resources and open a connection on each client.
+
+    Runs in a daemon thread started at import time, so credential resolution
+    and the TLS handshake overlap with the rest of the Lambda init instead of
+    landing on the first request. Failures are ignored; the first real call
+    simply pays the cost instead.
+    """
+    for table_name in (
+        PLAYER_TABLE, ACTIVITY_TABLE, TRACKING_TABLE, REFLECTION_TABLE, CONTENT_PAGES_TABLE,
+        TEAM_TABLE, CLUB_TABLE, COACH_TABLE, CLUB_ADMIN_TABLE,
+    ):
+        get_table(table_name)
+    # Every function's role can read the Players table
+    for client in (dynamodb.meta.client, _client):
+        try:
+            client.describe_table(TableName=PLAYER_TABLE)
+        except Exception:
+            pass
+
+
+def _get_item(table_name: str, key_name: str, key_value: str) -> Optional[Dict[str, Any]]:
+    """
+    GetItem by a string partition key through the low-level client.
+
+    Skips the resource layer's request/response transformation and
+    deserializes only the returned attributes; the result has the same shape
+    as Table.get_item()["Item"].
+
+    Raises:
+        ClientError: Propagated to the caller, like the resource API
+    """
+    response = _client.get_item(TableName=table_name, Key={key_name: {"S": key_value}})
+    item = response.get("Item")
+    if item is None:
+        return None
+    deserialize = _deserializer.deserialize
+    return {name: deserialize(value) for name, value in item.items()}
+
+
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    threading.Thread(target=_warm_up, daemon=True).start()
+
+
+def batch_reads(*readers: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent read callables concurrently.
+
+    Each reader is a zero-argument callable, typically a lambda wrapping one of
+    the getters below. Table reads only delegate to the underlying boto3
+    client, which is thread-safe, so the reads overlap and the total latency is
+    that of the slowest one rather than the sum.
+
+    Example:
+        club, teams = batch_reads(
+            lambda: get_club_by_id(club_id),
+            lambda: get_teams_by_club(club_id),
+        )
+
+    Args:
+        *readers: Zero-argument callables to run
+
+    Returns:
+        List of results in the same order as readers
+    """
+    futures = [_EXECUTOR.submit(reader) for reader in readers]
+    return [future.result() for future in futures]
+
+
+def _iter_items(operation, **request_kwargs) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items from every page of a query or scan.
+
+    A single query/scan response stops at 1 MB, so callers that only read the
+    first page silently miss items. This follows LastEvaluatedKey until the
+    result set is exhausted, fetching the next page only when it is needed.
+
+    Args:
+        operation: Bound table method, e.g. table.query or table.scan
+        **request_kwargs: Arguments for the operation
+
+    Yields:
+        Items in the order DynamoDB returns them
+    """
+    while True:
+        response = operation(**request_kwargs)
+        yield from response.get("Items", [])
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        request_kwargs["ExclusiveStartKey"] = last_key
+
+
+def _batch_get_by_ids(
+    table_name: str, key_name: str, ids: List[str], projection: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch items by primary key with BatchGetItem.
+
+    IDs are deduplicated and sent in chunks of 100. UnprocessedKeys (returned
+    when DynamoDB throttles part of a batch) are retried with exponential
+    backoff.
+
+    Args:
+        table_name: DynamoDB table name
+        key_name: Partition key attribute name
+        ids: IDs to fetch (duplicates and empty values are ignored)
+        projection: Attribute names to fetch, or None for full items. The key
+            attribute is always included.
+
+    Returns:
+        Dict mapping id -> item; IDs that do not exist are absent
+    """
+    unique_ids = list(dict.fromkeys(i for i in ids if i))
+    items: Dict[str, Dict[str, Any]] = {}
+    
+    request_template: Dict[str, Any] = {}
+    if projection:
+        _apply_projection(request_template, list(dict.fromkeys([key_name, *projection])))
+    
+    for start in range(0, len(unique_ids), _BATCH_GET_MAX_KEYS):
+        chunk = unique_ids[start:start + _BATCH_GET_MAX_KEYS]
+        request_items = {
+            table_name: {**request_template, "Keys": [{key_name: item_id} for item_id in chunk]}
+        }
+        for attempt in range(_BATCH_GET_MAX_RETRIES + 1):
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(table_name, []):
+                items[item[key_name]] = item
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                break
+            if attempt < _BATCH_GET_MAX_RETRIES:
+                time.sleep(0.05 * (2 ** attempt))
+        else:
+            logger.warning("%s keys left unprocessed in %s", len(request_items[table_name]["Keys"]), table_name)
+    
+    return items
+
+
+def _display_order_key(item: Dict[str, Any]) -> Any:
+    return item.get("displayOrder", 999)
+
+
+def _sort_by_display_order(items: List[Dict[str, Any]]) -> None:
+    """Sort items in place by displayOrder; items without one sort last. Items are not modified."""
+    items.sort(key=_display_order_key)
+
+
+def _with_attributes(projection: Optional[List[str]], *required: str) -> Optional[List[str]]:
+    """Extend a projection with attributes a helper reads itself (e.g. the displayOrder sort key)."""
+    if not projection:
+        return projection
+    return list(dict.fromkeys([*projection, *required]))
+
+
+def _apply_projection(request_kwargs: Dict[str, Any], projection: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Restrict a query/scan to the given attributes via ProjectionExpression.
+
+    Attribute names are aliased (#a0, #a1, ...) so reserved words such as
+    "name" or "date" can be projected.
+
+    Args:
+        request_kwargs: Keyword arguments for table.query/table.scan (modified in place)
+        projection: Attribute names to return, or None for full items
+
+    Returns:
+        The same request_kwargs dict
+    """
+    if projection:
+        names = {f"#a{i}": name for i, name in enumerate(projection)}
+        request_kwargs["ProjectionExpression"] = ", ".join(names)
+        request_kwargs.setdefault("ExpressionAttributeNames", {}).update(names)
+    return request_kwargs
 
 
 def get_player_by_id(player_id: str) -> Optional[Dict[str, Any]]:
     """Get a player by playerId."""
     try:
-        table = get_table(PLAYER_TABLE)
-        response = table.get_item(Key={"playerId": player_id})
-        return response.get("Item")
+        return _get_item(PLAYER_TABLE, "playerId", player_id)
     except ClientError as e:
-        print(f"Error getting player {player_id}: {e}")
+        logger.error("Error getting player %s: %s", player_id, e)
         return None
 
 
+def get_players_by_ids(ids: List[str], projection: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Get players by playerId in batches; returns a dict keyed by playerId."""
+    try:
+        return _batch_get_by_ids(PLAYER_TABLE, "playerId", ids, projection)
+    except ClientError as e:
+        logger.error("Error batch getting players: %s", e)
+        return {}
+
+
 def get_player_by_unique_link(unique_link: str) -> Optional[Dict[str, Any]]:
-    """Get a player by uniqueLink (requires scan, but uniqueLink should be indexed in production)."""
+    """Get a player by uniqueLink using the uniqueLink-index GSI."""
     try:
         table = get_table(PLAYER_TABLE)
-        response = table.scan(
-            FilterExpression="uniqueLink = :link",
+        response = table.query(
+            IndexName="uniqueLink-index",
+            KeyConditionExpression="uniqueLink = :link",
             ExpressionAttributeValues={":link": unique_link},
+            Limit=1,
         )
         items = response.get("Items", [])
         return items[0] if items else None
     except ClientError as e:
-        print(f"Error getting player by unique link {unique_link}: {e}")
+        logger.error("Error getting player by unique link %s: %s", unique_link, e)
         return None
 
 
-def get_player_by_email(email: str) -> Optional[Dict[str, Any]]:
-    """Get a player by email (requires scan, email should be indexed in production)."""
+# Cleared the first time the Players email-index turns out not to exist yet (it
+# ships in a second deploy; see database_stack.py), so later lookups go straight
+# to the scan instead of failing the query again.
+_player_email_index_available = True
+
+
+def get_player_by_email(email: str, projection: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Get a player by email using email-index GSI (scan fallback until it exists)."""
+    global _player_email_index_available
     try:
         table = get_table(PLAYER_TABLE)
-        response = table.scan(
-            FilterExpression="email = :email",
-            ExpressionAttributeValues={":email": email},
-        )
-        items = response.get("Items", [])
-        return items[0] if items else None
+        if _player_email_index_available:
+            query_kwargs = {
+                "IndexName": "email-index",
+                "KeyConditionExpression": "email = :email",
+                "ExpressionAttributeValues": {":email": email},
+                "Limit": 1,
+            }
+            try:
+                response = table.query(**_apply_projection(query_kwargs, projection))
+                items = response.get("Items", [])
+                return items[0] if items else None
+            except ClientError as e:
+                # DynamoDB reports a missing index as a ValidationException
+                if e.response.get("Error", {}).get("Code") not in (
+                    "ValidationException", "ResourceNotFoundException"
+                ):
+                    raise
+                logger.warning("Players email-index not available, falling back to scan: %s", e)
+                _player_email_index_available = False
+        scan_kwargs = {
+            "FilterExpression": "email = :email",
+            "ExpressionAttributeValues": {":email": email},
+        }
+        # A filtered scan can return empty pages before the match, so keep
+        # reading until the first hit or the end of the table.
+        return next(_iter_items(table.scan, **_apply_projection(scan_kwargs, projection)), None)
     except ClientError as e:
-        print(f"Error getting player by email {email}: {e}")
+        logger.error("Error getting player by email %s: %s", email, e)
         return None
 
 
-def get_activities_by_team(team_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+def get_activities_by_team(
+    team_id: str, active_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all activities for a team, optionally filtered to active only."""
     try:
         table = get_table(ACTIVITY_TABLE)
-        response = table.query(
-            IndexName="teamId-index",
-            KeyConditionExpression="teamId = :teamId",
-            ExpressionAttributeValues={":teamId": team_id},
-        )
-        activities = response.get("Items", [])
-        
+        query_kwargs = {
+            "IndexName": "teamId-index",
+            "KeyConditionExpression": "teamId = :teamId",
+            "ExpressionAttributeValues": {":teamId": team_id},
+        }
         if active_only:
-            activities = [a for a in activities if a.get("isActive", True)]
+            query_kwargs["FilterExpression"] = _ACTIVE_FILTER
+            query_kwargs["ExpressionAttributeValues"][":false"] = False
         
-        # Sort by displayOrder
-        activities.sort(key=lambda x: x.get("displayOrder", 999))
+        _apply_projection(query_kwargs, _with_attributes(projection, "displayOrder"))
+        activities = list(_iter_items(table.query, **query_kwargs))
+        
+        _sort_by_display_order(activities)
         return activities
     except ClientError as e:
-        print(f"Error getting activities for team {team_id}: {e}")
+        logger.error("Error getting activities for team %s: %s", team_id, e)
         return []
 
 
-def get_tracking_by_player_week(player_id: str, week_id: str) -> List[Dict[str, Any]]:
+def get_activities_by_ids(ids: List[str], projection: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Get activities by activityId in batches; returns a dict keyed by activityId."""
+    try:
+        return _batch_get_by_ids(ACTIVITY_TABLE, "activityId", ids, projection)
+    except ClientError as e:
+        logger.error("Error batch getting activities: %s", e)
+        return {}
+
+
+def get_tracking_by_player_week(
+    player_id: str, week_id: str, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all tracking records for a player in a specific week."""
     try:
         table = get_table(TRACKING_TABLE)
-        response = table.query(
-            IndexName="playerId-index",
-            KeyConditionExpression="playerId = :playerId",
-            FilterExpression="weekId = :weekId",
-            ExpressionAttributeValues={
+        query_kwargs = {
+            "IndexName": "playerId-index",
+            "KeyConditionExpression": "playerId = :playerId",
+            "FilterExpression": "weekId = :weekId",
+            "ExpressionAttributeValues": {
                 ":playerId": player_id,
                 ":weekId": week_id,
             },
-        )
-        return response.get("Items", [])
+        }
+        return list(_iter_items(table.query, **_apply_projection(query_kwargs, projection)))
     except ClientError as e:
-        print(f"Error getting tracking for player {player_id}, week {week_id}: {e}")
+        logger.error("Error getting tracking for player %s, week %s: %s", player_id, week_id, e)
         return []
 
 
-def get_tracking_by_week(week_id: str) -> List[Dict[str, Any]]:
+def _query_tracking_by_week(week_id: str, projection: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily query a week's tracking records; a ClientError surfaces mid-iteration."""
+    table = get_table(TRACKING_TABLE)
+    query_kwargs = {
+        "IndexName": "weekId-index",
+        "KeyConditionExpression": "weekId = :weekId",
+        "ExpressionAttributeValues": {":weekId": week_id},
+    }
+    return _iter_items(table.query, **_apply_projection(query_kwargs, projection))
+
+
+def iter_tracking_by_week(week_id: str, projection: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream tracking records for a week one page at a time.
+
+    Only one 1 MB page is held in memory, so callers that aggregate as they go
+    (the leaderboard) do not materialize the whole week. A ClientError is
+    logged and ends the stream, so callers get the records read so far (none
+    if the first page fails) instead of an exception.
+    """
+    try:
+        yield from _query_tracking_by_week(week_id, projection)
+    except ClientError as e:
+        logger.error("Error getting tracking for week %s: %s", week_id, e)
+
+
+def get_tracking_by_week(week_id: str, projection: Optional[List[str]] = None) -> List[Dict[str, Any]]:
     """Get all tracking records for a specific week (for leaderboard)."""
     try:
-        table = get_table(TRACKING_TABLE)
-        response = table.query(
-            IndexName="weekId-index",
-            KeyConditionExpression="weekId = :weekId",
-            ExpressionAttributeValues={":weekId": week_id},
-        )
-        return response.get("Items", [])
+        return list(_query_tracking_by_week(week_id, projection))
     except ClientError as e:
-        print(f"Error getting tracking for week {week_id}: {e}")
+        logger.error("Error getting tracking for week %s: %s", week_id, e)
         return []
 
 
@@ -135,156 +482,207 @@ def get_reflection_by_player_week(player_id: str, week_id: str) -> Optional[Dict
         response = table.get_item(Key={"reflectionId": reflection_id})
         return response.get("Item")
     except ClientError as e:
-        print(f"Error getting reflection for player {player_id}, week {week_id}: {e}")
+        logger.error("Error getting reflection for player %s, week %s: %s", player_id, week_id, e)
         return None
 
 
-def get_content_pages_by_team(team_id: str, published_only: bool = True) -> List[Dict[str, Any]]:
+def get_content_pages_by_team(
+    team_id: str, published_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all content pages for a team, optionally filtered to published only."""
     try:
         table = get_table(CONTENT_PAGES_TABLE)
-        response = table.query(
-            IndexName="teamId-index",
-            KeyConditionExpression="teamId = :teamId",
-            ExpressionAttributeValues={":teamId": team_id},
-        )
-        pages = response.get("Items", [])
-        
+        query_kwargs = {
+            "IndexName": "teamId-index",
+            "KeyConditionExpression": "teamId = :teamId",
+            "ExpressionAttributeValues": {":teamId": team_id},
+        }
         if published_only:
-            pages = [p for p in pages if p.get("isPublished", False)]
+            query_kwargs["FilterExpression"] = _PUBLISHED_FILTER
+            query_kwargs["ExpressionAttributeValues"][":true"] = True
         
-        # Sort by displayOrder
-        pages.sort(key=lambda x: x.get("displayOrder", 999))
+        pages = list(_iter_items(
+            table.query, **_apply_projection(query_kwargs, _with_attributes(projection, "displayOrder"))
+        ))
+        
+        _sort_by_display_order(pages)
         return pages
     except ClientError as e:
-        print(f"Error getting content pages for team {team_id}: {e}")
+        logger.error("Error getting content pages for team %s: %s", team_id, e)
         return []
 
 
-def get_content_page_by_slug(team_id: str, slug: str) -> Optional[Dict[str, Any]]:
-    """Get a content page by slug for a team."""
+def get_content_page_by_id(page_id: str) -> Optional[Dict[str, Any]]:
+    """Get a content page by pageId."""
     try:
-        pages = get_content_pages_by_team(team_id, published_only=False)
-        for page in pages:
-            if page.get("slug") == slug:
-                return page
+        return _get_item(CONTENT_PAGES_TABLE, "pageId", page_id)
+    except ClientError as e:
+        logger.error("Error getting content page %s: %s", page_id, e)
         return None
-    except Exception as e:
-        print(f"Error getting content page by slug {slug}: {e}")
+
+
+def get_content_page_by_slug(team_id: str, slug: str) -> Optional[Dict[str, Any]]:
+    """Get a content page by slug for a team using the teamId-slug-index GSI."""
+    try:
+        table = get_table(CONTENT_PAGES_TABLE)
+        response = table.query(
+            IndexName="teamId-slug-index",
+            KeyConditionExpression="teamId = :teamId AND slug = :slug",
+            ExpressionAttributeValues={":teamId": team_id, ":slug": slug},
+            Limit=1,
+        )
+        items = response.get("Items", [])
+        return items[0] if items else None
+    except ClientError as e:
+        logger.error("Error getting content page by slug %s: %s", slug, e)
         return None
 
 
+@ttl_cache(seconds=LOOKUP_CACHE_TTL_SECONDS)
 def get_club_by_id(club_id: str) -> Optional[Dict[str, Any]]:
-    """Get a club by clubId."""
+    """Get a club by clubId (cached; see invalidate_club)."""
     try:
         table = get_table(CLUB_TABLE)
         response = table.get_item(Key={"clubId": club_id})
         return response.get("Item")
     except ClientError as e:
-        print(f"Error getting club {club_id}: {e}")
+        logger.error("Error getting club %s: %s", club_id, e)
         return None
 
 
+@ttl_cache(seconds=LOOKUP_CACHE_TTL_SECONDS)
 def get_team_by_id(team_id: str) -> Optional[Dict[str, Any]]:
-    """Get a team by teamId."""
+    """Get a team by teamId (cached; see invalidate_team)."""
     try:
-        table = get_table(TEAM_TABLE)
-        response = table.get_item(Key={"teamId": team_id})
-        return response.get("Item")
+        return _get_item(TEAM_TABLE, "teamId", team_id)
     except ClientError as e:
-        print(f"Error getting team {team_id}: {e}")
+        logger.error("Error getting team %s: %s", team_id, e)
         return None
 
 
-def get_teams_by_club(club_id: str, active_only: bool = False) -> List[Dict[str, Any]]:
+def invalidate_club(club_id: str) -> None:
+    """Drop the cached get_club_by_id entry after a club write."""
+    get_club_by_id.invalidate(club_id)
+
+
+def invalidate_team(team_id: str) -> None:
+    """Drop the cached get_team_by_id entry after a team write."""
+    get_team_by_id.invalidate(team_id)
+
+
+def get_teams_by_ids(ids: List[str], projection: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Get teams by teamId in batches; returns a dict keyed by teamId."""
+    try:
+        return _batch_get_by_ids(TEAM_TABLE, "teamId", ids, projection)
+    except ClientError as e:
+        logger.error("Error batch getting teams: %s", e)
+        return {}
+
+
+def get_teams_by_club(
+    club_id: str, active_only: bool = False, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all teams for a club, optionally filtered to active only."""
     try:
         table = get_table(TEAM_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        teams = response.get("Items", [])
-        
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "ExpressionAttributeValues": {":clubId": club_id},
+        }
         if active_only:
-            teams = [t for t in teams if t.get("isActive", True)]
+            query_kwargs["FilterExpression"] = _ACTIVE_FILTER
+            query_kwargs["ExpressionAttributeValues"][":false"] = False
         
-        return teams
+        return list(_iter_items(table.query, **_apply_projection(query_kwargs, projection)))
     except ClientError as e:
-        print(f"Error getting teams for club {club_id}: {e}")
+        logger.error("Error getting teams for club %s: %s", club_id, e)
         return []
 
 
-def get_players_by_club(club_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+def get_players_by_club(
+    club_id: str, active_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all players for a club."""
     try:
         table = get_table(PLAYER_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        players = response.get("Items", [])
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "ExpressionAttributeValues": {":clubId": club_id},
+        }
         if active_only:
-            players = [p for p in players if p.get("isActive", True)]
-        return players
+            query_kwargs["FilterExpression"] = _ACTIVE_FILTER
+            query_kwargs["ExpressionAttributeValues"][":false"] = False
+        
+        return list(_iter_items(table.query, **_apply_projection(query_kwargs, projection)))
     except ClientError as e:
-        print(f"Error getting players for club {club_id}: {e}")
+        logger.error("Error getting players for club %s: %s", club_id, e)
         return []
 
 
-def get_activities_by_club(club_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+def get_activities_by_club(
+    club_id: str, active_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all club-wide activities (where teamId is null or empty)."""
     try:
         table = get_table(ACTIVITY_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        activities = response.get("Items", [])
-        
-        # Filter to club-wide only (teamId is null or empty)
-        activities = [a for a in activities if not a.get("teamId")]
-        
+        # Filter to club-wide only (no teamId)
+        filters = [_CLUB_WIDE_FILTER]
+        values = {":clubId": club_id}
         if active_only:
-            activities = [a for a in activities if a.get("isActive", True)]
+            filters.append(_ACTIVE_FILTER)
+            values[":false"] = False
+        
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "FilterExpression": " AND ".join(filters),
+            "ExpressionAttributeValues": values,
+        }
+        _apply_projection(query_kwargs, _with_attributes(projection, "displayOrder"))
+        activities = list(_iter_items(table.query, **query_kwargs))
         
-        # Sort by displayOrder
-        activities.sort(key=lambda x: x.get("displayOrder", 999))
+        _sort_by_display_order(activities)
         return activities
     except ClientError as e:
-        print(f"Error getting activities for club {club_id}: {e}")
+        logger.error("Error getting activities for club %s: %s", club_id, e)
         return []
 
 
-def get_content_pages_by_club(club_id: str, published_only: bool = True) -> List[Dict[str, Any]]:
+def get_content_pages_by_club(
+    club_id: str, published_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all club-wide content pages (where teamId is null or empty)."""
     try:
         table = get_table(CONTENT_PAGES_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        pages = response.get("Items", [])
-        
-        # Filter to club-wide only (teamId is null or empty)
-        pages = [p for p in pages if not p.get("teamId")]
-        
+        # Filter to club-wide only (no teamId)
+        filters = [_CLUB_WIDE_FILTER]
+        values = {":clubId": club_id}
         if published_only:
-            pages = [p for p in pages if p.get("isPublished", False)]
+            filters.append(_PUBLISHED_FILTER)
+            values[":true"] = True
         
-        # Sort by displayOrder
-        pages.sort(key=lambda x: x.get("displayOrder", 999))
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "FilterExpression": " AND ".join(filters),
+            "ExpressionAttributeValues": values,
+        }
+        pages = list(_iter_items(
+            table.query, **_apply_projection(query_kwargs, _with_attributes(projection, "displayOrder"))
+        ))
+        
+        _sort_by_display_order(pages)
         return pages
     except ClientError as e:
-        print(f"Error getting content pages for club {club_id}: {e}")
+        logger.error("Error getting content pages for club %s: %s", club_id, e)
         return []
 
 
-def get_all_content_pages_by_club(club_id: str, published_only: bool = True) -> List[Dict[str, Any]]:
+def get_all_content_pages_by_club(
+    club_id: str, published_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get ALL content pages for a club (both club-wide and team-specific).
     
     This function returns all content pages for a club regardless of scope,
@@ -295,32 +693,57 @@ def get_all_content_pages_by_club(club_id: str, published_only: bool = True) ->
     Args:
         club_id: The club ID
         published_only: If True, only return published content
+        projection: Attribute names to fetch (e.g. CONTENT_PAGE_SUMMARY_FIELDS),
+            or None for full items
     
     Returns:
         List of content page dictionaries, sorted by displayOrder
     """
     try:
         table = get_table(CONTENT_PAGES_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        pages = response.get("Items", [])
-        
         # No filtering by teamId - includes both club-wide and team-specific
-        
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "ExpressionAttributeValues": {":clubId": club_id},
+        }
         if published_only:
-            pages = [p for p in pages if p.get("isPublished", False)]
+            query_kwargs["FilterExpression"] = _PUBLISHED_FILTER
+            query_kwargs["ExpressionAttributeValues"][":true"] = True
         
-        # Sort by displayOrder
-        pages.sort(key=lambda x: x.get("displayOrder", 999))
+        pages = list(_iter_items(
+            table.query, **_apply_projection(query_kwargs, _with_attributes(projection, "displayOrder"))
+        ))
+        
+        _sort_by_display_order(pages)
         return pages
     except ClientError as e:
-        print(f"Error getting all content pages for club {club_id}: {e}")
+        logger.error("Error getting all content pages for club %s: %s", club_id, e)
         return []
 
 
+def _build_tracking_item(
+    player_id: str,
+    week_id: str,
+    date: str,
+    completed_activities: List[str],
+    daily_score: int,
+    team_id: str,
+    club_id: str,
+) -> Dict[str, Any]:
+    """Build a tracking item (without timestamps) keyed by playerId#weekId#date."""
+    return {
+        "trackingId": f"{player_id}#{week_id}#{date}",
+        "playerId": player_id,
+        "weekId": week_id,
+        "date": date,
+        "completedActivities": completed_activities,
+        "dailyScore": daily_score,
+        "teamId": team_id,
+        "clubId": club_id,
+    }
+
+
 def create_tracking_record(
     player_id: str,
     week_id: str,
@@ -333,34 +756,65 @@ def create_tracking_record(
     """Create or update a tracking record."""
     try:
         table = get_table(TRACKING_TABLE)
-        tracking_id = f"{player_id}#{week_id}#{date}"
+        item = _build_tracking_item(
+            player_id, week_id, date, completed_activities, daily_score, team_id, club_id
+        )
+        tracking_id = item.pop("trackingId")
         
-        from datetime import datetime
-        now = datetime.utcnow().isoformat() + "Z"
+        values = {f":{name}": value for name, value in item.items()}
+        values[":now"] = _utc_now_iso()
         
-        item = {
-            "trackingId": tracking_id,
-            "playerId": player_id,
-            "weekId": week_id,
-            "date": date,
-            "completedActivities": completed_activities,
-            "dailyScore": daily_score,
-            "teamId": team_id,
-            "clubId": club_id,
-            "updatedAt": now,
-        }
-        
-        # Check if record exists
-        existing = table.get_item(Key={"trackingId": tracking_id})
-        if "Item" in existing:
-            item["createdAt"] = existing["Item"].get("createdAt", now)
-        else:
-            item["createdAt"] = now
-        
-        table.put_item(Item=item)
-        return item
+        # Single round trip: if_not_exists keeps the original createdAt when
+        # the record already exists, so no read-before-write is needed.
+        response = table.update_item(
+            Key={"trackingId": tracking_id},
+            UpdateExpression=(
+                "SET playerId = :playerId, weekId = :weekId, #date = :date, "
+                "completedActivities = :completedActivities, dailyScore = :dailyScore, "
+                "teamId = :teamId, clubId = :clubId, updatedAt = :now, "
+                "createdAt = if_not_exists(createdAt, :now)"
+            ),
+            ExpressionAttributeNames={"#date": "date"},
+            ExpressionAttributeValues=values,
+            ReturnValues="ALL_NEW",
+        )
+        return response["Attributes"]
     except ClientError as e:
-        print(f"Error creating tracking record: {e}")
+        logger.error("Error creating tracking record: %s", e)
+        raise
+
+
+def create_tracking_records_bulk(records: List[Dict[str, Any]]) -> int:
+    """
+    Write many tracking records with BatchWriteItem (25 items per request).
+    
+    Intended for imports and multi-day syncs. Unlike create_tracking_record,
+    items are written with PutItem semantics, so an existing record's
+    createdAt is replaced. Records sharing a trackingId are collapsed to the
+    last one.
+    
+    Args:
+        records: Dicts of create_tracking_record keyword arguments
+            (player_id, week_id, date, completed_activities, daily_score,
+            team_id, club_id)
+    
+    Returns:
+        Number of records processed (duplicates included)
+    """
+    try:
+        table = get_table(TRACKING_TABLE)
+        now = _utc_now_iso()
+        # batch_writer buffers puts into 25-item requests and resends
+        # UnprocessedItems itself
+        with table.batch_writer(overwrite_by_pkeys=["trackingId"]) as batch:
+            for record in records:
+                item = _build_tracking_item(**record)
+                item["createdAt"] = now
+                item["updatedAt"] = now
+                batch.put_item(Item=item)
+        return len(records)
+    except ClientError as e:
+        logger.error("Error bulk creating tracking records: %s", e)
         raise
 
 
@@ -378,148 +832,194 @@ def create_or_update_reflection(
         table = get_table(REFLECTION_TABLE)
         reflection_id = f"{player_id}#{week_id}"
         
-        from datetime import datetime
-        now = datetime.utcnow().isoformat() + "Z"
+        now = _utc_now_iso()
         
-        # Check if reflection exists
-        existing = table.get_item(Key={"reflectionId": reflection_id})
-        created_at = existing.get("Item", {}).get("createdAt", now) if "Item" in existing else now
-        
-        item = {
-            "reflectionId": reflection_id,
-            "playerId": player_id,
-            "weekId": week_id,
-            "wentWell": went_well,
-            "doBetter": do_better,
-            "planForWeek": plan_for_week,
-            "teamId": team_id,
-            "clubId": club_id,
-            "createdAt": created_at,
-            "updatedAt": now,
-        }
-        
-        table.put_item(Item=item)
-        return item
+        # Single round trip: if_not_exists keeps the original createdAt when
+        # the reflection already exists, so no read-before-write is needed.
+        response = table.update_item(
+            Key={"reflectionId": reflection_id},
+            UpdateExpression=(
+                "SET playerId = :playerId, weekId = :weekId, wentWell = :wentWell, "
+                "doBetter = :doBetter, planForWeek = :planForWeek, "
+                "teamId = :teamId, clubId = :clubId, updatedAt = :now, "
+                "createdAt = if_not_exists(createdAt, :now)"
+            ),
+            ExpressionAttributeValues={
+                ":playerId": player_id,
+                ":weekId": week_id,
+                ":wentWell": went_well,
+                ":doBetter": do_better,
+                ":planForWeek": plan_for_week,
+                ":teamId": team_id,
+                ":clubId": club_id,
+                ":now": now,
+            },
+            ReturnValues="ALL_NEW",
+        )
+        return response["Attributes"]
     except ClientError as e:
-        print(f"Error creating/updating reflection: {e}")
+        logger.error("Error creating/updating reflection: %s", e)
         raise
 
 
+@ttl_cache(seconds=LOOKUP_CACHE_TTL_SECONDS)
 def get_coach_by_id(coach_id: str) -> Optional[Dict[str, Any]]:
-    """Get a coach by coachId."""
+    """Get a coach by coachId (cached; see invalidate_coach)."""
     try:
         table = get_table(COACH_TABLE)
         response = table.get_item(Key={"coachId": coach_id})
         return response.get("Item")
     except ClientError as e:
-        print(f"Error getting coach {coach_id}: {e}")
+        logger.error("Error getting coach %s: %s", coach_id, e)
         return None
 
 
-def get_coach_by_email(email: str) -> Optional[Dict[str, Any]]:
+def invalidate_coach(coach_id: str) -> None:
+    """Drop the cached get_coach_by_id entry after a coach write."""
+    get_coach_by_id.invalidate(coach_id)
+
+
+def get_coach_by_email(email: str, projection: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """Get a coach by email using email-index GSI."""
     try:
         table = get_table(COACH_TABLE)
-        response = table.query(
-            IndexName="email-index",
-            KeyConditionExpression="email = :email",
-            ExpressionAttributeValues={":email": email},
-        )
-        items = response.get("Items", [])
-        return items[0] if items else None
+        query_kwargs = {
+            "IndexName": "email-index",
+            "KeyConditionExpression": "email = :email",
+            "ExpressionAttributeValues": {":email": email},
+        }
+        return next(_iter_items(table.query, **_apply_projection(query_kwargs, projection)), None)
     except ClientError as e:
-        print(f"Error getting coach by email {email}: {e}")
+        logger.error("Error getting coach by email %s: %s", email, e)
         return None
 
 
-def get_coaches_by_team(team_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+def get_coaches_by_team(
+    team_id: str, active_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all coaches for a team."""
     try:
         table = get_table(COACH_TABLE)
-        response = table.query(
-            IndexName="teamId-index",
-            KeyConditionExpression="teamId = :teamId",
-            ExpressionAttributeValues={":teamId": team_id},
-        )
-        coaches = response.get("Items", [])
-        
+        query_kwargs = {
+            "IndexName": "teamId-index",
+            "KeyConditionExpression": "teamId = :teamId",
+            "ExpressionAttributeValues": {":teamId": team_id},
+        }
         if active_only:
-            coaches = [c for c in coaches if c.get("isActive", True)]
+            query_kwargs["FilterExpression"] = _ACTIVE_FILTER
+            query_kwargs["ExpressionAttributeValues"][":false"] = False
         
-        return coaches
+        return list(_iter_items(table.query, **_apply_projection(query_kwargs, projection)))
     except ClientError as e:
-        print(f"Error getting coaches for team {team_id}: {e}")
+        logger.error("Error getting coaches for team %s: %s", team_id, e)
         return []
 
 
-def get_coaches_by_club(club_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+def get_coaches_by_club(
+    club_id: str, active_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all coaches for a club."""
     try:
         table = get_table(COACH_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        coaches = response.get("Items", [])
-        
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "ExpressionAttributeValues": {":clubId": club_id},
+        }
         if active_only:
-            coaches = [c for c in coaches if c.get("isActive", True)]
+            query_kwargs["FilterExpression"] = _ACTIVE_FILTER
+            query_kwargs["ExpressionAttributeValues"][":false"] = False
         
-        return coaches
+        return list(_iter_items(table.query, **_apply_projection(query_kwargs, projection)))
     except ClientError as e:
-        print(f"Error getting coaches for club {club_id}: {e}")
+        logger.error("Error getting coaches for club %s: %s", club_id, e)
         return []
 
 
+@ttl_cache(seconds=LOOKUP_CACHE_TTL_SECONDS)
 def get_club_admin_by_id(admin_id: str) -> Optional[Dict[str, Any]]:
-    """Get a club admin by adminId."""
+    """Get a club admin by adminId (cached; see invalidate_club_admin)."""
     try:
         table = get_table(CLUB_ADMIN_TABLE)
         response = table.get_item(Key={"adminId": admin_id})
         return response.get("Item")
     except ClientError as e:
-        print(f"Error getting club admin {admin_id}: {e}")
+        logger.error("Error getting club admin %s: %s", admin_id, e)
         return None
 
 
-def get_club_admin_by_email(email: str) -> Optional[Dict[str, Any]]:
+def invalidate_club_admin(admin_id: str) -> None:
+    """Drop the cached get_club_admin_by_id entry after a club admin write."""
+    get_club_admin_by_id.invalidate(admin_id)
+
+
+def get_club_admin_by_email(email: str, projection: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """Get a club admin by email using email-index GSI."""
     try:
         table = get_table(CLUB_ADMIN_TABLE)
-        response = table.query(
-            IndexName="email-index",
-            KeyConditionExpression="email = :email",
-            ExpressionAttributeValues={":email": email},
-        )
-        items = response.get("Items", [])
-        return items[0] if items else None
+        query_kwargs = {
+            "IndexName": "email-index",
+            "KeyConditionExpression": "email = :email",
+            "ExpressionAttributeValues": {":email": email},
+        }
+        return next(_iter_items(table.query, **_apply_projection(query_kwargs, projection)), None)
     except ClientError as e:
-        print(f"Error getting club admin by email {email}: {e}")
+        logger.error("Error getting club admin by email %s: %s", email, e)
         return None
 
 
-def get_club_admins_by_club(club_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+def get_club_admins_by_club(
+    club_id: str, active_only: bool = True, projection: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """Get all club admins for a club."""
     try:
         table = get_table(CLUB_ADMIN_TABLE)
-        response = table.query(
-            IndexName="clubId-index",
-            KeyConditionExpression="clubId = :clubId",
-            ExpressionAttributeValues={":clubId": club_id},
-        )
-        admins = response.get("Items", [])
-        
+        query_kwargs = {
+            "IndexName": "clubId-index",
+            "KeyConditionExpression": "clubId = :clubId",
+            "ExpressionAttributeValues": {":clubId": club_id},
+        }
         if active_only:
-            admins = [a for a in admins if a.get("isActive", True)]
+            query_kwargs["FilterExpression"] = _ACTIVE_FILTER
+            query_kwargs["ExpressionAttributeValues"][":false"] = False
         
-        return admins
+        return list(_iter_items(table.query, **_apply_projection(query_kwargs, projection)))
     except ClientError as e:
-        print(f"Error getting club admins for club {club_id}: {e}")
+        logger.error("Error getting club admins for club %s: %s", club_id, e)
         return []
 
 
-def update_user_verification_status(email: str, status: str, user_type: str = None) -> dict:
+@ttl_cache(seconds=LOOKUP_CACHE_TTL_SECONDS, maxsize=1024, cache_if=lambda status: status != "pending")
+def get_verification_status_by_email(email: str) -> Optional[str]:
+    """
+    Get the verificationStatus of the coach or club admin with this email.
+
+    Both email-index GSIs are queried at once (GSIs cannot be read with
+    BatchGetItem); a coach match wins over a club admin. Settled statuses are
+    cached (see update_user_verification_status); "pending" is not, since
+    verification may complete in another container at any moment.
+
+    Args:
+        email: User's email address
+
+    Returns:
+        The verificationStatus ("" if the item has none), or None if the email
+        belongs to neither a coach nor a club admin
+    """
+    coach, admin = batch_reads(
+        lambda: get_coach_by_email(email, projection=["verificationStatus"]),
+        lambda: get_club_admin_by_email(email, projection=["verificationStatus"]),
+    )
+    # A projected item without the attribute comes back as {}, so test for None
+    user = coach if coach is not None else admin
+    if user is None:
+        return None
+    return user.get("verificationStatus", "")
+
+
+def update_user_verification_status(
+    email: str, status: str, user_type: str = None, user_id: Optional[str] = None
+) -> dict:
     """
     Update verificationStatus for a user.
     
@@ -527,6 +1027,9 @@ def update_user_verification_status(email: str, status: str, user_type: str = No
         email: User's email address
         status: "pending" | "verified"
         user_type: "player" | "coach" | "club_admin" | None (auto-detect)
+        user_id: The user's playerId/coachId/adminId, if known. Together with
+            user_type this skips the email lookup and updates the item
+            directly, failing if it does not exist.
     
     Returns:
         dict with 'success' (bool), 'user_type' (str), and optional 'error'
@@ -537,84 +1040,83 @@ def update_user_verification_status(email: str, status: str, user_type: str = No
             "error": f"Invalid status: {status}. Must be 'pending' or 'verified'"
         }
     
+    require_existing = False
+    if user_type and user_id:
+        # Caller already knows the item; a conditional update replaces the
+        # email lookup and still refuses to create a new item.
+        if user_type not in _USER_TABLES:
+            return {
+                "success": False,
+                "error": f"Invalid user_type: {user_type}. Must be 'player', 'coach', or 'club_admin'"
+            }
+        require_existing = True
     # Auto-detect user type if not provided
-    if not user_type:
-        # Try to find user in each table
-        player = get_player_by_email(email)
+    elif not user_type:
+        # Query all three tables at once; a player match wins over a coach,
+        # and a coach over a club admin, as in the old sequential lookup
+        player, coach, admin = batch_reads(
+            lambda: get_player_by_email(email, projection=["playerId"]),
+            lambda: get_coach_by_email(email, projection=["coachId"]),
+            lambda: get_club_admin_by_email(email, projection=["adminId"]),
+        )
         if player:
             user_type = "player"
             user_id = player.get("playerId")
-            table_name = PLAYER_TABLE
-            key_name = "playerId"
+        elif coach:
+            user_type = "coach"
+            user_id = coach.get("coachId")
+        elif admin:
+            user_type = "club_admin"
+            user_id = admin.get("adminId")
         else:
-            coach = get_coach_by_email(email)
-            if coach:
-                user_type = "coach"
-                user_id = coach.get("coachId")
-                table_name = COACH_TABLE
-                key_name = "coachId"
-            else:
-                admin = get_club_admin_by_email(email)
-                if admin:
-                    user_type = "club_admin"
-                    user_id = admin.get("adminId")
-                    table_name = CLUB_ADMIN_TABLE
-                    key_name = "adminId"
-                else:
-                    return {
-                        "success": False,
-                        "error": f"User with email {email} not found in any table"
-                    }
+            return {
+                "success": False,
+                "error": f"User with email {email} not found in any table"
+            }
     else:
         # Use provided user_type
         if user_type == "player":
-            player = get_player_by_email(email)
+            player = get_player_by_email(email, projection=["playerId"])
             if not player:
                 return {"success": False, "error": f"Player with email {email} not found"}
             user_id = player.get("playerId")
-            table_name = PLAYER_TABLE
-            key_name = "playerId"
         elif user_type == "coach":
-            coach = get_coach_by_email(email)
+            coach = get_coach_by_email(email, projection=["coachId"])
             if not coach:
                 return {"success": False, "error": f"Coach with email {email} not found"}
             user_id = coach.get("coachId")
-            table_name = COACH_TABLE
-            key_name = "coachId"
         elif user_type == "club_admin":
-            admin = get_club_admin_by_email(email)
+            admin = get_club_admin_by_email(email, projection=["adminId"])
             if not admin:
                 return {"success": False, "error": f"Club admin with email {email} not found"}
             user_id = admin.get("adminId")
-            table_name = CLUB_ADMIN_TABLE
-            key_name = "adminId"
         else:
             return {
                 "success": False,
                 "error": f"Invalid user_type: {user_type}. Must be 'player', 'coach', or 'club_admin'"
             }
     
+    table_name, key_name = _USER_TABLES[user_type]
+    
     # Update the verification status
     try:
         table = get_table(table_name)
-        from datetime import datetime
-        
-        update_expression = "SET verificationStatus = :status, updatedAt = :updatedAt"
-        expression_attribute_values = {
-            ":status": status,
-            ":updatedAt": datetime.utcnow().isoformat() + "Z"
+        update_kwargs = {
+            "Key": {key_name: user_id},
+            "UpdateExpression": _VERIFICATION_UPDATE_EXPRESSION,
+            "ExpressionAttributeValues": {":status": status, ":updatedAt": _utc_now_iso()},
         }
+        if require_existing:
+            update_kwargs["ConditionExpression"] = f"attribute_exists({key_name})"
+        table.update_item(**update_kwargs)
+        if user_type == "coach":
+            invalidate_coach(user_id)
+            get_verification_status_by_email.invalidate(email)
+        elif user_type == "club_admin":
+            invalidate_club_admin(user_id)
+            get_verification_status_by_email.invalidate(email)
         
-        # If status is "verified", we can optionally remove the field instead
-        # For now, we'll set it to "verified" explicitly
-        
-        table.update_item(
-            Key={key_name: user_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_attribute_values
-        )
-        
-        print(f"Updated verificationStatus to '{status}' for {user_type} {email} ({user_id})")
+        logger.info("Updated verificationStatus to '%s' for %s %s (%s)", status, user_type, email, user_id)
         return {
             "success": True,
             "user_type": user_type,
@@ -622,8 +1124,14 @@ def update_user_verification_status(email: str, status: str, user_type: str = No
             "email": email
         }
     except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            return {
+                "success": False,
+                "error": f"{user_type} {user_id} not found",
+                "user_type": user_type
+            }
         error_msg = f"Error updating verification status for {user_type} {email}: {e}"
-        print(error_msg)
+        logger.error(error_msg)
         return {
             "success": False,
             "error": error_msg,
@@ -631,7 +1139,7 @@ def update_user_verification_status(email: str, status: str, user_type: str = No
         }
     except Exception as e:
         error_msg = f"Unexpected error updating verification status for {user_type} {email}: {e}"
-        print(error_msg)
+        logger.error(error_msg)
         return {
             "success": False,
             "error": error_msg,
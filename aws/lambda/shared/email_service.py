@@ -4,23 +4,250 @@ Provides functions to send templated and custom emails.
 """
 
 import os
+import re
+import time
 import uuid
+import random
+import threading
 import boto3
 import hmac
 import hashlib
 import base64
 import json
-from datetime import datetime, timedelta
+import string
+import logging
+from email.message import EmailMessage
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from shared.cache_utils import ttl_cache
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
+
 # SES configuration from environment variables
 SES_REGION = os.environ.get("SES_REGION", "us-east-1")
 SES_FROM_EMAIL = os.environ.get("SES_FROM_EMAIL", "noreply@repwarrior.net")
 SES_FROM_NAME = os.environ.get("SES_FROM_NAME", "Consistency Tracker")
 
-# Initialize SES client
-ses_client = boto3.client("ses", region_name=SES_REGION)
+# Basic address shape check. google-re2 (optional) matches in linear time with
+# no backtracking; without it, fall back to re, where \Z (unlike $) rejects a
+# trailing newline. RE2 has no \Z, but its $ already only matches at the end.
+_LOCAL_PATTERN = r"[a-zA-Z0-9._%+-]+"
+_DOMAIN_PATTERN = r"[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+try:
+    import re2
+    _EMAIL_RE = re2.compile(f"^{_LOCAL_PATTERN}@{_DOMAIN_PATTERN}$")
+    _LOCAL_RE = re2.compile(f"^{_LOCAL_PATTERN}$")
+    _DOMAIN_RE = re2.compile(f"^{_DOMAIN_PATTERN}$")
+except ImportError:
+    _EMAIL_RE = re.compile(rf"^{_LOCAL_PATTERN}@{_DOMAIN_PATTERN}\Z")
+    _LOCAL_RE = re.compile(rf"^{_LOCAL_PATTERN}\Z")
+    _DOMAIN_RE = re.compile(rf"^{_DOMAIN_PATTERN}\Z")
+
+# Character sets of the two halves above, for _has_email_shape
+_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
+# Upper bound on concurrent SES requests in send_bulk_email. The pool's
+# threads start lazily and are reused across warm invocations.
+SES_MAX_CONCURRENCY = int(os.environ.get("SES_MAX_CONCURRENCY", "14"))
+_SEND_POOL = ThreadPoolExecutor(max_workers=max(1, SES_MAX_CONCURRENCY))
+
+# SES limit on recipients per SendEmail message
+SES_MAX_RECIPIENTS = 50
+
+# Pace SES send calls from this container to at most SES_MAX_RPS per second
+# (the account's maximum send rate); 0 disables pacing.
+SES_MAX_RPS = float(os.environ.get("SES_MAX_RPS", "14"))
+_SEND_INTERVAL = 1.0 / SES_MAX_RPS if SES_MAX_RPS > 0 else 0.0
+_send_slot_lock = threading.Lock()
+_next_send_slot = 0.0
+
+# Cached GetSendQuota result (refreshed every SES_QUOTA_CACHE_SECONDS). Bulk
+# sends that would push the 24-hour count past SES_QUOTA_HEADROOM of the
+# quota are refused up front instead of failing recipient by recipient.
+SES_QUOTA_CACHE_SECONDS = 60
+SES_QUOTA_HEADROOM = 0.95
+_quota_cache: Dict[str, Any] = {"expires_at": 0.0, "max_24h": None, "sent_24h": None}
+
+# SES send attempts when SES reports throttling, and the backoff bounds (seconds)
+SES_THROTTLE_MAX_ATTEMPTS = 3
+_THROTTLE_BACKOFF_BASE = 0.2
+_THROTTLE_BACKOFF_CAP = 2.0
+_THROTTLE_ERROR_CODES = {"Throttling", "ThrottlingException", "TooManyRequestsException"}
+
+# How long a Cognito email_verified lookup is reused within a container.
+# Users that do not exist are not cached, so a just-created user is seen at once.
+COGNITO_STATUS_CACHE_SECONDS = 60
+
+
+@lru_cache(maxsize=1)
+def _get_ses_client():
+    """
+    SES client, created on first use and reused across warm invocations.
+    
+    The pool leaves headroom over SES_MAX_CONCURRENCY so parallel sends never
+    wait for (or discard) a connection, and keepalive lets warm invocations
+    reuse the TLS session. Throttling gets its own paced backoff in
+    _send_with_retry on top of botocore's standard retries.
+    """
+    return boto3.client(
+        "ses",
+        region_name=SES_REGION,
+        config=Config(
+            max_pool_connections=max(50, SES_MAX_CONCURRENCY * 2),
+            retries={"max_attempts": 3, "mode": "standard"},
+            tcp_keepalive=True,
+            connect_timeout=3,
+            read_timeout=10,
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_cognito_client(region: str):
+    """Cognito client for a region, built once and reused across calls and warm invocations."""
+    return boto3.client(
+        "cognito-idp",
+        region_name=region,
+        config=Config(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "standard"},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+def _is_throttle_error(error: ClientError) -> bool:
+    """True if SES rejected the request for exceeding a rate limit."""
+    details = error.response.get("Error", {})
+    return (
+        details.get("Code") in _THROTTLE_ERROR_CODES
+        # e.g. "Maximum sending rate exceeded." / "Rate exceeded"
+        or "rate exceeded" in details.get("Message", "").lower()
+    )
+
+
+def _wait_for_send_slot(messages: int = 1) -> None:
+    """
+    Block until the next SES send slot.
+    
+    Slots are handed out SES_MAX_RPS per second. Each caller reserves its slot
+    under the lock and sleeps outside it, so concurrent senders in
+    send_bulk_email queue up at even intervals instead of bursting.
+    
+    Args:
+        messages: Messages the upcoming request sends; SES counts each
+            destination of a bulk request against the rate
+    """
+    global _next_send_slot
+    if not _SEND_INTERVAL:
+        return
+    with _send_slot_lock:
+        now = time.monotonic()
+        slot = max(now, _next_send_slot)
+        _next_send_slot = slot + _SEND_INTERVAL * messages
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _send_with_retry(operation, messages: int = 1, **params) -> dict:
+    """
+    Call an SES send operation, pacing it and retrying throttling errors.
+    
+    Throttled requests are retried up to SES_THROTTLE_MAX_ATTEMPTS times with
+    exponential backoff and jitter, so parallel senders spread out. Other
+    errors are raised immediately.
+    
+    Args:
+        operation: Bound client method, e.g. _get_ses_client().send_email
+        messages: Messages the request sends (see _wait_for_send_slot)
+        **params: Arguments for the operation
+    
+    Returns:
+        The operation's response
+    
+    Raises:
+        ClientError: If SES rejects the request
+    """
+    for attempt in range(SES_THROTTLE_MAX_ATTEMPTS):
+        _wait_for_send_slot(messages)
+        try:
+            return operation(**params)
+        except ClientError as e:
+            if not _is_throttle_error(e) or attempt == SES_THROTTLE_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(_THROTTLE_BACKOFF_CAP, _THROTTLE_BACKOFF_BASE * 2 ** attempt)
+            logger.warning(
+                "SES throttled (%s), retrying in %.2fs", e.response.get("Error", {}).get("Code", ""), delay
+            )
+            time.sleep(delay + random.uniform(0, _THROTTLE_BACKOFF_BASE))
+
+
+def _quota_exceeded(messages: int) -> bool:
+    """
+    True if sending this many messages would exhaust the 24-hour SES quota.
+    
+    Uses the cached GetSendQuota result. If the quota cannot be read, sends
+    are allowed and SES remains the authority.
+    """
+    now = time.monotonic()
+    if now >= _quota_cache["expires_at"]:
+        try:
+            quota = _get_ses_client().get_send_quota()
+            _quota_cache.update(
+                expires_at=now + SES_QUOTA_CACHE_SECONDS,
+                max_24h=quota.get("Max24HourSend"),
+                sent_24h=quota.get("SentLast24Hours", 0.0),
+            )
+        except ClientError as e:
+            logger.warning("Could not read SES send quota: %s", e)
+            return False
+    max_24h = _quota_cache["max_24h"]
+    # A negative Max24HourSend means the account has no daily limit
+    if max_24h is None or max_24h < 0:
+        return False
+    return _quota_cache["sent_24h"] + messages > max_24h * SES_QUOTA_HEADROOM
+
+
+def _warm_up_ses() -> None:
+    """
+    Open the SES connection during Lambda init.
+    
+    GetSendQuota is a cheap read, so running it in a daemon thread at import
+    moves DNS resolution and the TLS handshake off the first send. Failures
+    are ignored; the first send simply pays the cost instead.
+    """
+    try:
+        _get_ses_client().get_send_quota()
+    except Exception:
+        pass
+
+
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    threading.Thread(target=_warm_up_ses, daemon=True).start()
+
+
+def _build_raw_message(
+    subject: str, html_body: str, text_body: str, from_address: str, reply_to: List[str] = None
+) -> bytes:
+    """Encode a MIME message without a To header, for reuse across SendRawEmail calls."""
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = from_address
+    if reply_to:
+        msg["Reply-To"] = ", ".join(reply_to)
+    if text_body:
+        msg.set_content(text_body)
+        msg.add_alternative(html_body, subtype="html")
+    else:
+        msg.set_content(html_body, subtype="html")
+    return msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
 
 
 def send_email(
@@ -35,6 +262,11 @@ def send_email(
     """
     Send an email via AWS SES.
     
+    SES accepts at most 50 recipients per message, so longer recipient lists
+    are sent as several raw messages of up to 50 recipients sharing one
+    pre-encoded MIME body. If a later chunk fails, the earlier chunks have
+    already been sent.
+    
     Args:
         to_addresses: List of recipient email addresses
         subject: Email subject line
@@ -45,7 +277,8 @@ def send_email(
         reply_to: List of reply-to email addresses (optional)
     
     Returns:
-        dict with 'message_id' if successful, None on error
+        dict with 'message_id' (of the first message) and 'message_ids' (one
+        per chunk) if successful
     
     Raises:
         ClientError: If SES send fails
@@ -57,11 +290,6 @@ def send_email(
     from_name = from_name or SES_FROM_NAME
     from_address = f"{from_name} <{from_email}>"
     
-    # Prepare destination
-    destination = {
-        "ToAddresses": to_addresses,
-    }
-    
     # Prepare message
     message = {
         "Subject": {"Data": subject, "Charset": "UTF-8"},
@@ -77,7 +305,6 @@ def send_email(
     # Prepare email parameters
     email_params = {
         "Source": from_address,
-        "Destination": destination,
         "Message": message,
     }
     
@@ -86,14 +313,33 @@ def send_email(
         email_params["ReplyToAddresses"] = reply_to
     
     try:
-        response = ses_client.send_email(**email_params)
-        message_id = response.get("MessageId")
-        print(f"Email sent successfully. MessageId: {message_id}")
-        return {"message_id": message_id, "success": True}
+        if len(to_addresses) <= SES_MAX_RECIPIENTS:
+            response = _send_with_retry(
+                _get_ses_client().send_email, len(to_addresses), Destination={"ToAddresses": to_addresses}, **email_params
+            )
+            message_ids = [response.get("MessageId")]
+        else:
+            # Several messages with identical content: encode the MIME body
+            # once and only prepend each chunk's To header, which SES also
+            # uses as the recipient list
+            raw_message = _build_raw_message(subject, html_body, text_body, from_address, reply_to)
+            message_ids = []
+            for start in range(0, len(to_addresses), SES_MAX_RECIPIENTS):
+                chunk = to_addresses[start:start + SES_MAX_RECIPIENTS]
+                to_header = f"To: {', '.join(chunk)}\r\n".encode("utf-8")
+                response = _send_with_retry(
+                    _get_ses_client().send_raw_email,
+                    len(chunk),
+                    Source=from_address,
+                    RawMessage={"Data": to_header + raw_message},
+                )
+                message_ids.append(response.get("MessageId"))
+        logger.info("Email sent successfully. MessageId: %s", ", ".join(message_ids))
+        return {"message_id": message_ids[0], "message_ids": message_ids, "success": True}
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "")
         error_message = e.response.get("Error", {}).get("Message", str(e))
-        print(f"Error sending email: {error_code} - {error_message}")
+        logger.error("Error sending email: %s - %s", error_code, error_message)
         raise
 
 
@@ -109,7 +355,8 @@ def send_templated_email(
     
     Args:
         to_addresses: List of recipient email addresses
-        template_data: Dictionary with 'html', 'text', and 'subject' keys
+        template_data: EmailPayload from email_templates, or a dict with
+            'html', 'text', and 'subject' keys
         from_email: From email address (optional)
         from_name: From display name (optional)
         reply_to: List of reply-to email addresses (optional)
@@ -148,6 +395,9 @@ def send_bulk_email(
     """
     Send bulk emails to multiple recipients (each can have different content).
     
+    Each destination gets its own SendEmail call with its TemplateData
+    filled in via str.format; the calls run concurrently on the shared pool.
+    
     Args:
         destinations: List of dicts with 'ToAddresses' and optional 'TemplateData'
         subject: Email subject line
@@ -157,35 +407,26 @@ def send_bulk_email(
         from_name: From display name (optional)
     
     Returns:
-        dict with 'message_id' if successful
+        dict with 'results' (one per destination with addresses, each with
+        'success' and 'message_id' or 'error') and 'total'
     
     Note: For simple bulk sends, use send_email with multiple ToAddresses.
     This function is for when you need different content per recipient.
     """
     from_email = from_email or SES_FROM_EMAIL
     from_name = from_name or SES_FROM_NAME
-    from_address = f"{from_name} <{from_email}>"
     
-    # Prepare message template
-    message_template = {
-        "Subject": {"Data": subject, "Charset": "UTF-8"},
-        "Body": {
-            "Html": {"Data": html_body, "Charset": "UTF-8"},
-        },
-    }
+    destinations = [dest for dest in destinations if dest.get("ToAddresses")]
+    if not destinations:
+        return {"results": [], "total": 0}
     
-    if text_body:
-        message_template["Body"]["Text"] = {"Data": text_body, "Charset": "UTF-8"}
-    
-    # Prepare destinations for send_bulk_templated_email format
-    # Note: SES send_bulk_templated_email requires templates, so we'll use send_email in a loop
-    # For better performance with many recipients, consider using SES templates
-    results = []
-    for dest in destinations:
-        to_addresses = dest.get("ToAddresses", [])
-        if not to_addresses:
-            continue
-        
+    message_count = sum(len(dest["ToAddresses"]) for dest in destinations)
+    if _quota_exceeded(message_count):
+        logger.error("Skipping bulk send of %d messages: SES 24-hour quota nearly exhausted", message_count)
+        error = "SES 24-hour sending quota exhausted"
+        return {"results": [{"success": False, "error": error} for _ in destinations], "total": len(destinations)}
+    
+    def _send_one(dest: dict) -> dict:
         # Customize message if TemplateData provided
         html = html_body
         text = text_body
@@ -196,22 +437,54 @@ def send_bulk_email(
                 text = text.format(**template_data)
         
         try:
-            result = send_email(
-                to_addresses=to_addresses,
+            return send_email(
+                to_addresses=dest["ToAddresses"],
                 subject=subject,
                 html_body=html,
                 text_body=text,
                 from_email=from_email,
                 from_name=from_name,
             )
-            results.append(result)
         except Exception as e:
-            print(f"Error sending email to {to_addresses}: {e}")
-            results.append({"success": False, "error": str(e)})
+            logger.error("Error sending email to %s: %s", dest["ToAddresses"], e)
+            return {"success": False, "error": str(e)}
+    
+    if len(destinations) == 1:
+        results = [_send_one(destinations[0])]
+    else:
+        # Each SendEmail is an independent request, so overlap them on the
+        # shared pool; map() keeps results in destination order.
+        results = list(_SEND_POOL.map(_send_one, destinations))
+    
+    # Keep the cached count roughly current until the next refresh
+    if _quota_cache["sent_24h"] is not None:
+        _quota_cache["sent_24h"] += message_count
     
     return {"results": results, "total": len(results)}
 
 
+def _has_email_shape(email: str) -> bool:
+    """
+    Linear pre-check with the same rules as _EMAIL_RE, using set containment
+    instead of the regex engine so invalid input is rejected cheaply.
+    """
+    local, at, domain = email.partition("@")
+    if not (at and local and _LOCAL_CHARS.issuperset(local)):
+        return False
+    # The TLD is letters only, so the pattern's final dot is the last one
+    head, dot, tld = domain.rpartition(".")
+    return bool(
+        dot and head and len(tld) >= 2 and tld.isascii() and tld.isalpha()
+        and _DOMAIN_CHARS.issuperset(head)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _domain_is_valid(domain: str) -> bool:
+    """Domain half of the address check, memoized since list entries share domains."""
+    return _DOMAIN_RE.match(domain) is not None
+
+
 def validate_email_address(email: str) -> bool:
     """
     Basic email validation.
@@ -222,25 +495,38 @@ def validate_email_address(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise
     """
-    import re
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return _has_email_shape(email) and _EMAIL_RE.match(email) is not None
 
 
 def validate_email_addresses(emails: List[str]) -> tuple[List[str], List[str]]:
     """
-    Validate a list of email addresses.
+    Validate a list of email addresses, dropping duplicates.
+    
+    Valid addresses that differ only in case or surrounding whitespace count
+    as duplicates; the first valid occurrence is kept, so SES quota is not
+    spent sending the same message twice. Invalid entries are all reported
+    and never hide a later valid spelling of the same address.
     
     Args:
         emails: List of email addresses to validate
     
     Returns:
-        Tuple of (valid_emails, invalid_emails)
+        Tuple of (valid_emails, invalid_emails), each in input order
     """
     valid = []
     invalid = []
+    seen = set()
+    match_local = _LOCAL_RE.match
     for email in emails:
-        if validate_email_address(email):
+        key = email.strip().lower()
+        if key in seen:
+            continue
+        # Same rules as _EMAIL_RE, but the domain half is checked once per
+        # distinct domain
+        local, at, domain = email.partition("@")
+        if at and _domain_is_valid(domain) and match_local(local) is not None:
+            # Only a valid address claims the key
+            seen.add(key)
             valid.append(email)
         else:
             invalid.append(email)
@@ -270,8 +556,8 @@ def verify_email_identity(email: str) -> dict:
         }
     
     try:
-        response = ses_client.verify_email_identity(EmailAddress=email)
-        print(f"Verification email sent to {email}")
+        response = _get_ses_client().verify_email_identity(EmailAddress=email)
+        logger.info("Verification email sent to %s", email)
         return {
             "success": True,
             "message": f"Verification email sent to {email}. The recipient must click the verification link to complete verification.",
@@ -283,7 +569,7 @@ def verify_email_identity(email: str) -> dict:
         
         # If email is already verified, that's fine
         if error_code == "AlreadyExistsException":
-            print(f"Email {email} is already verified in SES")
+            logger.info("Email %s is already verified in SES", email)
             return {
                 "success": True,
                 "message": "Email address is already verified",
@@ -291,14 +577,14 @@ def verify_email_identity(email: str) -> dict:
                 "already_verified": True
             }
         
-        print(f"Error verifying email {email}: {error_code} - {error_message}")
+        logger.error("Error verifying email %s: %s - %s", email, error_code, error_message)
         return {
             "success": False,
             "error": f"{error_code}: {error_message}",
             "email": email
         }
     except Exception as e:
-        print(f"Unexpected error verifying email {email}: {e}")
+        logger.error("Unexpected error verifying email %s: %s", email, e)
         return {
             "success": False,
             "error": str(e),
@@ -314,23 +600,81 @@ def _get_verification_secret() -> str:
     return secret
 
 
-def _generate_signed_token(email: str, expires_at: int) -> Tuple[str, str]:
+@lru_cache(maxsize=1)
+def _get_token_hmac() -> hmac.HMAC:
+    """
+    Get a keyed HMAC-SHA256 prototype for signing verification tokens.
+    
+    The secret is read and the key schedule computed once per container;
+    callers must .copy() the prototype before updating it.
+    """
+    return hmac.new(_get_verification_secret().encode('utf-8'), digestmod=hashlib.sha256)
+
+
+def _sign_token_payload(payload_b64: str) -> str:
+    """Compute the unpadded base64url token signature for an encoded payload segment."""
+    mac = _get_token_hmac().copy()
+    mac.update(payload_b64.encode('utf-8'))
+    return base64.urlsafe_b64encode(mac.digest()).rstrip(b'=').decode('ascii')
+
+
+def _get_token_epoch(email: str) -> int:
+    """
+    Get the current verification token epoch for an email address.
+    
+    Args:
+        email: Email address
+    
+    Returns:
+        The email's currentEpoch, or 0 if its tokens were never invalidated
+    """
+    from shared.db_utils import EMAIL_VERIFICATION_STATE_TABLE, get_client
+    
+    # Strongly consistent so a token issued right after an invalidation
+    # carries the new epoch
+    response = get_client().get_item(
+        TableName=EMAIL_VERIFICATION_STATE_TABLE,
+        Key={"email": {"S": email}},
+        ProjectionExpression="currentEpoch",
+        ConsistentRead=True
+    )
+    return int(response.get("Item", {}).get("currentEpoch", {}).get("N", 0))
+
+
+def _mark_token_used(token: str) -> None:
+    """Mark a verification token as used."""
+    from shared.db_utils import EMAIL_VERIFICATION_TABLE, get_client
+    
+    get_client().update_item(
+        TableName=EMAIL_VERIFICATION_TABLE,
+        Key={"token": {"S": token}},
+        UpdateExpression="SET #status = :status",
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={":status": {"S": "used"}}
+    )
+
+
+def _generate_signed_token(email: str, expires_at: int, epoch: int = 0, issued_at: int = None) -> Tuple[str, str]:
     """
     Generate an HMAC-signed token for email verification.
     
     Args:
         email: Email address to verify
         expires_at: Unix timestamp when token expires
+        epoch: Token epoch for the email (see _get_token_epoch)
+        issued_at: Unix timestamp of issue (defaults to now)
     
     Returns:
         Tuple of (token, token_id) where token is the signed token string
     """
     token_id = str(uuid.uuid4())
-    issued_at = int(datetime.utcnow().timestamp())
+    if issued_at is None:
+        issued_at = int(time.time())
     
     # Create payload
     payload = {
         "email": email,
+        "epoch": epoch,
         "exp": expires_at,
         "iat": issued_at,
         "jti": token_id
@@ -339,29 +683,26 @@ def _generate_signed_token(email: str, expires_at: int) -> Tuple[str, str]:
     # Serialize payload (sorted keys for consistency)
     payload_json = json.dumps(payload, sort_keys=True, separators=(',', ':'))
     
-    # Sign with HMAC-SHA256
-    secret = _get_verification_secret()
-    signature = hmac.new(
-        secret.encode('utf-8'),
-        payload_json.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    
     # Encode payload as base64url (URL-safe)
     payload_b64 = base64.urlsafe_b64encode(payload_json.encode('utf-8')).decode('utf-8').rstrip('=')
     
+    # Sign the encoded payload exactly as it appears in the token, so the
+    # validator can check it without decoding or re-serializing JSON
+    signature = _sign_token_payload(payload_b64)
+    
     # Token format: base64(payload).signature
     token = f"{payload_b64}.{signature}"
     
     return token, token_id
 
 
-def _validate_token_signature(token: str) -> dict:
+def _validate_token_signature(token: str, now: int = None) -> dict:
     """
     Validate token signature and extract payload.
     
     Args:
         token: Signed token string
+        now: Current Unix timestamp, if the caller already has it
     
     Returns:
         dict with 'valid' (bool), 'payload' (if valid), and 'error' (if invalid)
@@ -374,7 +715,14 @@ def _validate_token_signature(token: str) -> dict:
         
         payload_b64, signature = parts
         
-        # Decode payload (add padding if needed)
+        # Verify signature over the payload as received, before any decoding
+        expected_signature = _sign_token_payload(payload_b64)
+        
+        # Use constant-time comparison to prevent timing attacks
+        if not hmac.compare_digest(signature, expected_signature):
+            return {"valid": False, "error": "Invalid token signature"}
+        
+        # Decode payload only once it is known to be authentic (add padding if needed)
         padding = 4 - len(payload_b64) % 4
         if padding != 4:
             payload_b64 += '=' * padding
@@ -382,20 +730,8 @@ def _validate_token_signature(token: str) -> dict:
         payload_json = base64.urlsafe_b64decode(payload_b64).decode('utf-8')
         payload = json.loads(payload_json)
         
-        # Verify signature
-        secret = _get_verification_secret()
-        expected_signature = hmac.new(
-            secret.encode('utf-8'),
-            json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        # Use constant-time comparison to prevent timing attacks
-        if not hmac.compare_digest(signature, expected_signature):
-            return {"valid": False, "error": "Invalid token signature"}
-        
         # Check expiration
-        current_time = int(datetime.utcnow().timestamp())
+        current_time = int(time.time()) if now is None else now
         if current_time > payload.get("exp", 0):
             return {"valid": False, "error": "Token expired"}
         
@@ -407,18 +743,20 @@ def _validate_token_signature(token: str) -> dict:
         return {"valid": False, "error": f"Token validation error: {str(e)}"}
 
 
-def generate_email_verification_token(email: str, frontend_url: str = None) -> dict:
+def generate_email_verification_token(email: str, frontend_url: str = None, epoch: int = None) -> dict:
     """
     Generate a verification token and store it in DynamoDB.
     
     Args:
         email: Email address to verify
         frontend_url: Frontend URL for verification link (defaults to FRONTEND_URL env var)
+        epoch: Current token epoch for the email, if the caller already has
+            it (read from the state table otherwise)
     
     Returns:
         dict with 'token', 'verification_url', 'email', and 'expires_at'
     """
-    from shared.db_utils import EMAIL_VERIFICATION_TABLE, get_table
+    from shared.db_utils import EMAIL_VERIFICATION_TABLE, get_client
     
     if not validate_email_address(email):
         return {
@@ -427,12 +765,16 @@ def generate_email_verification_token(email: str, frontend_url: str = None) -> d
         }
     
     # Calculate expiration (1 hour from now)
-    expires_at = int((datetime.utcnow() + timedelta(hours=1)).timestamp())
+    now = int(time.time())
+    expires_at = now + 3600
     
-    # Generate signed token
+    # Generate signed token under the email's current epoch
     try:
-        token, token_id = _generate_signed_token(email, expires_at)
-    except ValueError as e:
+        if epoch is None:
+            epoch = _get_token_epoch(email)
+        token, token_id = _generate_signed_token(email, expires_at, epoch, now)
+    except Exception as e:
+        logger.error("Error generating verification token for %s: %s", email, e)
         return {
             "success": False,
             "error": str(e),
@@ -444,18 +786,18 @@ def generate_email_verification_token(email: str, frontend_url: str = None) -> d
     verification_url = f"{frontend_url}/verify-email?token={token}"
     
     try:
-        table = get_table(EMAIL_VERIFICATION_TABLE)
-        table.put_item(
+        get_client().put_item(
+            TableName=EMAIL_VERIFICATION_TABLE,
             Item={
-                "token": token,
-                "tokenId": token_id,  # Store token ID for lookup
-                "email": email,
-                "status": "pending",
-                "createdAt": datetime.utcnow().isoformat() + "Z",
-                "expiresAt": expires_at,
+                "token": {"S": token},
+                "tokenId": {"S": token_id},  # Store token ID for lookup
+                "email": {"S": email},
+                "status": {"S": "pending"},
+                "createdAt": {"S": datetime.utcnow().isoformat() + "Z"},
+                "expiresAt": {"N": str(expires_at)},
             }
         )
-        print(f"Generated signed verification token for {email}")
+        logger.info("Generated signed verification token for %s", email)
         return {
             "success": True,
             "token": token,
@@ -464,7 +806,7 @@ def generate_email_verification_token(email: str, frontend_url: str = None) -> d
             "expires_at": expires_at
         }
     except Exception as e:
-        print(f"Error generating verification token for {email}: {e}")
+        logger.error("Error generating verification token for %s: %s", email, e)
         return {
             "success": False,
             "error": str(e),
@@ -472,10 +814,40 @@ def generate_email_verification_token(email: str, frontend_url: str = None) -> d
         }
 
 
+@ttl_cache(seconds=COGNITO_STATUS_CACHE_SECONDS, maxsize=1024)
+def _get_cognito_email_verified(user_pool_id: str, email: str) -> Optional[bool]:
+    """
+    Look up a Cognito user's email_verified attribute.
+    
+    Returns:
+        True/False for an existing user, or None if the user does not exist
+    
+    Raises:
+        ClientError: For Cognito errors other than UserNotFoundException
+    """
+    cognito_client = _get_cognito_client(os.environ.get("COGNITO_REGION", "us-east-1"))
+    try:
+        response = cognito_client.admin_get_user(
+            UserPoolId=user_pool_id,
+            Username=email
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code", "") == "UserNotFoundException":
+            return None
+        raise
+    
+    # Check email_verified attribute
+    attributes = {attr['Name']: attr['Value'] for attr in response.get('UserAttributes', [])}
+    return attributes.get('email_verified', 'false').lower() == 'true'
+
+
 def check_cognito_email_verified(user_pool_id: str, email: str) -> dict:
     """
     Check if a Cognito user's email is already verified.
     
+    Results for existing users are cached for COGNITO_STATUS_CACHE_SECONDS;
+    verify_cognito_email drops the cached entry when it marks an email verified.
+    
     Args:
         user_pool_id: Cognito User Pool ID
         email: Email address (used as username)
@@ -491,15 +863,12 @@ def check_cognito_email_verified(user_pool_id: str, email: str) -> dict:
         }
     
     try:
-        cognito_client = boto3.client("cognito-idp", region_name=os.environ.get("COGNITO_REGION", "us-east-1"))
-        response = cognito_client.admin_get_user(
-            UserPoolId=user_pool_id,
-            Username=email
-        )
-        
-        # Check email_verified attribute
-        attributes = {attr['Name']: attr['Value'] for attr in response.get('UserAttributes', [])}
-        email_verified = attributes.get('email_verified', 'false').lower() == 'true'
+        email_verified = _get_cognito_email_verified(user_pool_id, email)
+        if email_verified is None:
+            return {
+                "verified": False,
+                "exists": False
+            }
         
         return {
             "verified": email_verified,
@@ -507,11 +876,6 @@ def check_cognito_email_verified(user_pool_id: str, email: str) -> dict:
         }
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "")
-        if error_code == "UserNotFoundException":
-            return {
-                "verified": False,
-                "exists": False
-            }
         return {
             "verified": False,
             "exists": False,
@@ -529,54 +893,36 @@ def invalidate_pending_tokens(email: str) -> dict:
     """
     Invalidate all pending verification tokens for an email address.
     
+    Bumps the email's currentEpoch with a single UpdateItem. Tokens carry the
+    epoch they were issued under, and validate_and_verify_email rejects any
+    token whose epoch is no longer current, so no per-token writes are needed.
+    
     Args:
         email: Email address
     
     Returns:
-        dict with 'success' and 'count' of invalidated tokens
+        dict with 'success' and the new 'epoch'
     """
-    from shared.db_utils import EMAIL_VERIFICATION_TABLE, get_table
+    from shared.db_utils import EMAIL_VERIFICATION_STATE_TABLE, get_client
     
     try:
-        table = get_table(EMAIL_VERIFICATION_TABLE)
-        
-        # Query by email using GSI
-        response = table.query(
-            IndexName="email-index",
-            KeyConditionExpression="email = :email",
-            FilterExpression="#status = :status",
-            ExpressionAttributeNames={"#status": "status"},
-            ExpressionAttributeValues={":email": email, ":status": "pending"}
+        response = get_client().update_item(
+            TableName=EMAIL_VERIFICATION_STATE_TABLE,
+            Key={"email": {"S": email}},
+            UpdateExpression="ADD currentEpoch :one",
+            ExpressionAttributeValues={":one": {"N": "1"}},
+            ReturnValues="UPDATED_NEW"
         )
         
-        items = response.get("Items", [])
-        count = 0
-        
-        # Mark all pending tokens as used
-        for item in items:
-            token = item.get("token")
-            if token:
-                try:
-                    table.update_item(
-                        Key={"token": token},
-                        UpdateExpression="SET #status = :status",
-                        ExpressionAttributeNames={"#status": "status"},
-                        ExpressionAttributeValues={":status": "used"}
-                    )
-                    count += 1
-                except Exception as e:
-                    print(f"Error invalidating token {token}: {e}")
-        
         return {
             "success": True,
-            "count": count
+            "epoch": int(response["Attributes"]["currentEpoch"]["N"])
         }
     except Exception as e:
-        print(f"Error invalidating pending tokens for {email}: {e}")
+        logger.error("Error invalidating pending tokens for %s: %s", email, e)
         return {
             "success": False,
-            "error": str(e),
-            "count": 0
+            "error": str(e)
         }
 
 
@@ -593,7 +939,6 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
         dict with 'success' and optional 'error' or 'message'
     """
     from shared.db_utils import RESEND_TRACKING_TABLE, get_table
-    from datetime import datetime, timedelta
     
     if not validate_email_address(email):
         return {
@@ -601,6 +946,16 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
             "error": "Invalid email address format"
         }
     
+    if not user_pool_id:
+        user_pool_id = os.environ.get("COGNITO_USER_POOL_ID")
+    
+    # The Cognito lookup does not depend on the rate-limit read, so start it
+    # on the shared pool and overlap the two round-trips
+    verification_future = (
+        _SEND_POOL.submit(check_cognito_email_verified, user_pool_id, email)
+        if user_pool_id else None
+    )
+    
     # Check rate limiting (max 1 request per 5 minutes per email)
     try:
         table = get_table(RESEND_TRACKING_TABLE)
@@ -609,7 +964,7 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
         if "Item" in response:
             item = response["Item"]
             last_resend = item.get("lastResendTimestamp", 0)
-            current_time = int(datetime.utcnow().timestamp())
+            current_time = int(time.time())
             time_since_last = current_time - last_resend
             min_interval = 300  # 5 minutes
             
@@ -620,15 +975,12 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
                     "error": f"Please wait {remaining // 60 + 1} minutes before requesting another verification email."
                 }
     except Exception as e:
-        print(f"Error checking resend rate limit for {email}: {e}")
+        logger.warning("Error checking resend rate limit for %s: %s", email, e)
         # Continue anyway - don't block on rate limit check error
     
     # Check if email is already verified
-    if not user_pool_id:
-        user_pool_id = os.environ.get("COGNITO_USER_POOL_ID")
-    
-    if user_pool_id:
-        verification_status = check_cognito_email_verified(user_pool_id, email)
+    if verification_future is not None:
+        verification_status = verification_future.result()
         if verification_status.get("verified"):
             # Email already verified - return generic success (don't reveal status)
             return {
@@ -638,10 +990,10 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
         # If user doesn't exist, we'll still send the email (don't reveal if user exists)
     
     # Invalidate old pending tokens
-    invalidate_pending_tokens(email)
+    invalidation = invalidate_pending_tokens(email)
     
-    # Generate new token
-    token_result = generate_email_verification_token(email, frontend_url)
+    # Generate new token under the epoch just set, saving a read of it
+    token_result = generate_email_verification_token(email, frontend_url, invalidation.get("epoch"))
     if not token_result.get("success"):
         return {
             "success": False,
@@ -658,7 +1010,7 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
         
         # Record resend timestamp
         try:
-            current_time = int(datetime.utcnow().timestamp())
+            current_time = int(time.time())
             expires_at = current_time + 300  # TTL: 5 minutes
             table.put_item(
                 Item={
@@ -668,7 +1020,7 @@ def resend_verification_token(email: str, user_pool_id: str = None, frontend_url
                 }
             )
         except Exception as e:
-            print(f"Error recording resend timestamp for {email}: {e}")
+            logger.warning("Error recording resend timestamp for %s: %s", email, e)
         
         return {
             "success": True,
@@ -699,7 +1051,7 @@ def verify_cognito_email(user_pool_id: str, email: str) -> dict:
         }
     
     try:
-        cognito_client = boto3.client("cognito-idp", region_name=os.environ.get("COGNITO_REGION", "us-east-2"))
+        cognito_client = _get_cognito_client(os.environ.get("COGNITO_REGION", "us-east-2"))
         cognito_client.admin_update_user_attributes(
             UserPoolId=user_pool_id,
             Username=email,
@@ -707,7 +1059,8 @@ def verify_cognito_email(user_pool_id: str, email: str) -> dict:
                 {'Name': 'email_verified', 'Value': 'true'}
             ]
         )
-        print(f"Updated Cognito email_verified for {email}")
+        _get_cognito_email_verified.invalidate(user_pool_id, email)
+        logger.info("Updated Cognito email_verified for %s", email)
         return {
             "success": True,
             "email": email
@@ -715,14 +1068,14 @@ def verify_cognito_email(user_pool_id: str, email: str) -> dict:
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "")
         error_message = e.response.get("Error", {}).get("Message", str(e))
-        print(f"Error updating Cognito email verification for {email}: {error_code} - {error_message}")
+        logger.error("Error updating Cognito email verification for %s: %s - %s", email, error_code, error_message)
         return {
             "success": False,
             "error": f"{error_code}: {error_message}",
             "email": email
         }
     except Exception as e:
-        print(f"Unexpected error updating Cognito email verification for {email}: {e}")
+        logger.error("Unexpected error updating Cognito email verification for %s: %s", email, e)
         return {
             "success": False,
             "error": str(e),
@@ -741,7 +1094,7 @@ def validate_and_verify_email(token: str, user_pool_id: str = None) -> dict:
     Returns:
         dict with 'success', 'email', and optional 'error' or 'message'
     """
-    from shared.db_utils import EMAIL_VERIFICATION_TABLE, get_table
+    from shared.db_utils import EMAIL_VERIFICATION_TABLE, get_client
     
     if not token:
         return {
@@ -762,44 +1115,44 @@ def validate_and_verify_email(token: str, user_pool_id: str = None) -> dict:
     email_from_token = payload.get("email")
     
     try:
-        table = get_table(EMAIL_VERIFICATION_TABLE)
-        response = table.get_item(Key={"token": token})
-        
-        if "Item" not in response:
+        # Tokens issued before the last invalidation were superseded by a newer link
+        if payload.get("epoch", 0) != _get_token_epoch(email_from_token):
             return {
                 "success": False,
-                "error": "Invalid verification token"
+                "error": "This verification link is no longer valid. Please use the most recent link sent to you."
             }
         
-        item = response["Item"]
-        email = item.get("email")
-        status = item.get("status", "pending")
-        expires_at = item.get("expiresAt")
+        # The signature already vouches for the email and expiry, so the
+        # stored item is only needed for its single-use status
+        response = get_client().get_item(
+            TableName=EMAIL_VERIFICATION_TABLE,
+            Key={"token": {"S": token}},
+            ProjectionExpression="#status",
+            ExpressionAttributeNames={"#status": "status"}
+        )
         
-        # Verify email from token matches email in database
-        if email_from_token != email:
+        if "Item" not in response:
             return {
                 "success": False,
-                "error": "Token email mismatch"
+                "error": "Invalid verification token"
             }
         
+        email = email_from_token
+        
         # Check if token is already used
-        if status == "used":
+        if response["Item"].get("status", {}).get("S", "pending") == "used":
             return {
                 "success": False,
                 "error": "This verification link has already been used"
             }
         
-        # Expiration already checked in signature validation, but double-check
-        if expires_at:
-            current_time = int(datetime.utcnow().timestamp())
-            if current_time > expires_at:
-                return {
-                    "success": False,
-                    "error": "This verification link has expired"
-                }
+        if not user_pool_id:
+            user_pool_id = os.environ.get("COGNITO_USER_POOL_ID")
         
-        # Verify email in SES
+        # Verify email in SES first. Cognito is only marked verified once SES
+        # succeeds: resend_verification_token treats email_verified as done,
+        # so updating Cognito after an SES failure would leave the user with
+        # no way to get a new link.
         ses_result = verify_email_identity(email)
         if not ses_result.get("success"):
             return {
@@ -809,19 +1162,12 @@ def validate_and_verify_email(token: str, user_pool_id: str = None) -> dict:
             }
         
         # Update Cognito email verification
-        if not user_pool_id:
-            user_pool_id = os.environ.get("COGNITO_USER_POOL_ID")
-        
         cognito_result = verify_cognito_email(user_pool_id, email)
+        
         if not cognito_result.get("success"):
             # SES verification succeeded but Cognito update failed
             # Still mark token as used to prevent retry
-            table.update_item(
-                Key={"token": token},
-                UpdateExpression="SET #status = :status",
-                ExpressionAttributeNames={"#status": "status"},
-                ExpressionAttributeValues={":status": "used"}
-            )
+            _mark_token_used(token)
             return {
                 "success": False,
                 "error": f"Email verified in SES but failed to update Cognito: {cognito_result.get('error', 'Unknown error')}",
@@ -829,14 +1175,9 @@ def validate_and_verify_email(token: str, user_pool_id: str = None) -> dict:
             }
         
         # Mark token as used
-        table.update_item(
-            Key={"token": token},
-            UpdateExpression="SET #status = :status",
-            ExpressionAttributeNames={"#status": "status"},
-            ExpressionAttributeValues={":status": "used"}
-        )
+        _mark_token_used(token)
         
-        print(f"Email verification completed successfully for {email}")
+        logger.debug("Email verification completed successfully for %s", email)
         return {
             "success": True,
             "email": email,
@@ -844,7 +1185,7 @@ def validate_and_verify_email(token: str, user_pool_id: str = None) -> dict:
         }
         
     except Exception as e:
-        print(f"Error validating verification token: {e}")
+        logger.error("Error validating verification token: %s", e)
         return {
             "success": False,
             "error": str(e)
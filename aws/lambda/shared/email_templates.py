@@ -1,233 +1,370 @@
 """
 Email templates for application emails.
 Provides HTML and plain text versions of all email templates.
+
+Bodies are string.Template objects built once at import, so rendering is a
+single substitute() call rather than re-evaluating a large f-string. The
+source indentation is stripped from them at the same time, so it is never
+rendered or sent.
 """
 
+import re
+import textwrap
+from html import escape
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Dict, List
+from string import Template
 
-def get_password_reset_template(reset_link: str, user_name: str = "User") -> dict:
-    """Generate password reset email template."""
-    html_body = f"""
+
+# Layout shared by every HTML email: document head, heading card and footer.
+# The page title and heading are filled in per template at import time.
+_HTML_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Reset Your Password</title>
+        <title>%s</title>
     </head>
     <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
         <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Password Reset Request</h1>
+            <h1 style="color: #2c3e50; margin-top: 0;">%s</h1>
         </div>
-        <p>Hello {user_name},</p>
+"""
+
+_HTML_FOOTER = """        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
+        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
+    </body>
+    </html>
+    """
+
+_TEXT_FOOTER = """    ---
+    This is an automated message from Consistency Tracker. Please do not reply to this email.
+    """
+
+_PAYLOAD_FIELDS = frozenset(("html", "text", "subject"))
+
+
+@dataclass(frozen=True, slots=True)
+class EmailPayload:
+    """
+    A rendered email, as returned by the get_*_template functions.
+    
+    Also readable like the dicts those functions used to return
+    (payload["html"], payload.get("text"), "subject" in payload), so it can
+    be passed straight to send_templated_email.
+    """
+    html: str
+    text: str
+    subject: str
+    
+    def __getitem__(self, key: str) -> str:
+        if key not in _PAYLOAD_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in _PAYLOAD_FIELDS
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _PAYLOAD_FIELDS else default
+
+
+# Whitespace between tags only indents the source; browsers ignore it
+_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+
+
+# subject is a plain str when it has no fields, so it is returned as is
+_EmailSpec = namedtuple("_EmailSpec", "html text subject")
+
+
+def _html_template(title: str, heading: str, body: str) -> Template:
+    """Wrap an email-specific HTML fragment in the shared page layout, minified."""
+    html = _HTML_HEAD % (title, heading) + body + _HTML_FOOTER
+    return Template(_BETWEEN_TAGS_RE.sub("><", html.strip()))
+
+
+def _text_template(body: str) -> Template:
+    """Append the shared footer to an email-specific plain text body, dedented."""
+    return Template(textwrap.dedent(body + _TEXT_FOOTER).strip())
+
+
+_PASSWORD_RESET_HTML = _html_template(
+    "Reset Your Password",
+    "Password Reset Request",
+    """        <p>Hello $user_name,</p>
         <p>We received a request to reset your password for your Consistency Tracker account.</p>
         <p>Click the button below to reset your password:</p>
         <div style="text-align: center; margin: 30px 0;">
-            <a href="{reset_link}" style="background-color: #3498db; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Reset Password</a>
+            <a href="$reset_link" style="background-color: #3498db; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Reset Password</a>
         </div>
         <p>Or copy and paste this link into your browser:</p>
-        <p style="word-break: break-all; color: #7f8c8d; font-size: 12px;">{reset_link}</p>
+        <p style="word-break: break-all; color: #7f8c8d; font-size: 12px;">$reset_link</p>
         <p>This link will expire in 24 hours.</p>
         <p>If you didn't request a password reset, please ignore this email.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_body = f"""
+""",
+)
+
+_PASSWORD_RESET_TEXT = _text_template("""
     Password Reset Request
     
-    Hello {user_name},
+    Hello $user_name,
     
     We received a request to reset your password for your Consistency Tracker account.
     
     Click the link below to reset your password:
-    {reset_link}
+    $reset_link
     
     This link will expire in 24 hours.
     
     If you didn't request a password reset, please ignore this email.
     
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
-    """
-    
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": "Reset Your Password - Consistency Tracker"
-    }
+""")
 
+_PASSWORD_RESET_SUBJECT = "Reset Your Password - Consistency Tracker"
 
-def get_user_invitation_template(
-    user_name: str,
-    email: str,
-    temporary_password: str,
-    login_url: str,
-    role: str = "administrator"
-) -> dict:
-    """Generate user invitation email template."""
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Welcome to Consistency Tracker</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Welcome to Consistency Tracker</h1>
-        </div>
-        <p>Hello {user_name},</p>
-        <p>You have been invited to join Consistency Tracker as a {role}.</p>
+
+# User, player and coach invitations share one body; only the invitation
+# sentence, the closing words and the subject differ. %(...)s slots are
+# filled per kind at import, $fields at render time.
+_INVITATION_HTML = """        <p>Hello $name,</p>
+        <p>%(invite_html)s</p>
         <p>Your account has been created with the following credentials:</p>
         <div style="background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0;">
-            <p style="margin: 5px 0;"><strong>Email:</strong> {email}</p>
-            <p style="margin: 5px 0;"><strong>Temporary Password:</strong> {temporary_password}</p>
+            <p style="margin: 5px 0;"><strong>Email:</strong> $email</p>
+            <p style="margin: 5px 0;"><strong>Temporary Password:</strong> $temporary_password</p>
         </div>
         <p><strong>Important:</strong> You must change your password on first login.</p>
         <div style="text-align: center; margin: 30px 0;">
-            <a href="{login_url}" style="background-color: #27ae60; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Login Now</a>
+            <a href="$login_url" style="background-color: #27ae60; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Login Now</a>
         </div>
-        <p>After logging in, you'll be prompted to set a new password.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_body = f"""
+        <p>After logging in, you'll be prompted to set a new password%(next_steps)s.</p>
+"""
+
+_INVITATION_TEXT = """
     Welcome to Consistency Tracker
     
-    Hello {user_name},
+    Hello $name,
     
-    You have been invited to join Consistency Tracker as a {role}.
+    %(invite_text)s
     
     Your account has been created with the following credentials:
     
-    Email: {email}
-    Temporary Password: {temporary_password}
+    Email: $email
+    Temporary Password: $temporary_password
     
     Important: You must change your password on first login.
     
-    Login at: {login_url}
-    
-    After logging in, you'll be prompted to set a new password.
+    Login at: $login_url
     
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
-    """
+    After logging in, you'll be prompted to set a new password%(next_steps)s.
     
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": f"Welcome to Consistency Tracker - {role.title()} Account Created"
-    }
+"""
 
 
-def get_club_creation_template(club_name: str, club_id: str, admin_email: str) -> dict:
-    """Generate club creation confirmation email template."""
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Club Created - Consistency Tracker</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Club Created Successfully</h1>
-        </div>
-        <p>Hello,</p>
-        <p>Your club <strong>{club_name}</strong> has been successfully created in Consistency Tracker.</p>
+def _invitation(invite_html: str, invite_text: str, next_steps: str, subject: str) -> _EmailSpec:
+    """Build an invitation _EmailSpec from the shared invitation body."""
+    parts = {"invite_html": invite_html, "invite_text": invite_text, "next_steps": next_steps}
+    return _EmailSpec(
+        _html_template("Welcome to Consistency Tracker", "Welcome to Consistency Tracker", _INVITATION_HTML % parts),
+        _text_template(_INVITATION_TEXT % parts),
+        Template(subject),
+    )
+
+
+_CLUB_CREATION_HTML = _html_template(
+    "Club Created - Consistency Tracker",
+    "Club Created Successfully",
+    """        <p>Hello,</p>
+        <p>Your club <strong>$club_name</strong> has been successfully created in Consistency Tracker.</p>
         <div style="background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0;">
-            <p style="margin: 5px 0;"><strong>Club Name:</strong> {club_name}</p>
-            <p style="margin: 5px 0;"><strong>Club ID:</strong> {club_id}</p>
-            <p style="margin: 5px 0;"><strong>Admin Email:</strong> {admin_email}</p>
+            <p style="margin: 5px 0;"><strong>Club Name:</strong> $club_name</p>
+            <p style="margin: 5px 0;"><strong>Club ID:</strong> $club_id</p>
+            <p style="margin: 5px 0;"><strong>Admin Email:</strong> $admin_email</p>
         </div>
         <p>You can now start creating teams and managing your club through the admin dashboard.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_body = f"""
+""",
+)
+
+_CLUB_CREATION_TEXT = _text_template("""
     Club Created Successfully
     
     Hello,
     
-    Your club {club_name} has been successfully created in Consistency Tracker.
+    Your club $club_name has been successfully created in Consistency Tracker.
     
-    Club Name: {club_name}
-    Club ID: {club_id}
-    Admin Email: {admin_email}
+    Club Name: $club_name
+    Club ID: $club_id
+    Admin Email: $admin_email
     
     You can now start creating teams and managing your club through the admin dashboard.
     
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
-    """
-    
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": f"Club Created: {club_name}"
-    }
+""")
 
+_CLUB_CREATION_SUBJECT = Template("Club Created: $club_name")
 
-def get_team_creation_template(team_name: str, club_name: str, team_id: str) -> dict:
-    """Generate team creation confirmation email template."""
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Team Created - Consistency Tracker</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Team Created Successfully</h1>
-        </div>
-        <p>Hello,</p>
-        <p>Your team <strong>{team_name}</strong> has been successfully created in club <strong>{club_name}</strong>.</p>
+
+_TEAM_CREATION_HTML = _html_template(
+    "Team Created - Consistency Tracker",
+    "Team Created Successfully",
+    """        <p>Hello,</p>
+        <p>Your team <strong>$team_name</strong> has been successfully created in club <strong>$club_name</strong>.</p>
         <div style="background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0;">
-            <p style="margin: 5px 0;"><strong>Team Name:</strong> {team_name}</p>
-            <p style="margin: 5px 0;"><strong>Club:</strong> {club_name}</p>
-            <p style="margin: 5px 0;"><strong>Team ID:</strong> {team_id}</p>
+            <p style="margin: 5px 0;"><strong>Team Name:</strong> $team_name</p>
+            <p style="margin: 5px 0;"><strong>Club:</strong> $club_name</p>
+            <p style="margin: 5px 0;"><strong>Team ID:</strong> $team_id</p>
         </div>
         <p>You can now start adding players and managing your team through the admin dashboard.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_body = f"""
+""",
+)
+
+_TEAM_CREATION_TEXT = _text_template("""
     Team Created Successfully
     
     Hello,
     
-    Your team {team_name} has been successfully created in club {club_name}.
+    Your team $team_name has been successfully created in club $club_name.
     
-    Team Name: {team_name}
-    Club: {club_name}
-    Team ID: {team_id}
+    Team Name: $team_name
+    Club: $club_name
+    Team ID: $team_id
     
     You can now start adding players and managing your team through the admin dashboard.
     
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
+""")
+
+_TEAM_CREATION_SUBJECT = Template("Team Created: $team_name")
+
+
+_EMAIL_VERIFICATION_HTML = _html_template(
+    "Verify Your Email - Consistency Tracker",
+    "Verify Your Email Address",
+    """        <p>Hello $user_name,</p>
+        <p>Thank you for joining Consistency Tracker! Please verify your email address to complete your account setup and start using the platform.</p>
+        <p>Click the button below to verify your email address:</p>
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="$verification_url" style="background-color: #27ae60; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Verify Email Address</a>
+        </div>
+        <p>Or copy and paste this link into your browser:</p>
+        <p style="word-break: break-all; color: #7f8c8d; font-size: 12px;">$verification_url</p>
+        <p>This verification link will expire in 1 hour.</p>
+        <p>If you didn't create an account with Consistency Tracker, please ignore this email.</p>
+""",
+)
+
+_EMAIL_VERIFICATION_TEXT = _text_template("""
+    Verify Your Email Address - Consistency Tracker
+    
+    Hello $user_name,
+    
+    Thank you for joining Consistency Tracker! Please verify your email address to complete your account setup and start using the platform.
+    
+    Click the link below to verify your email address:
+    $verification_url
+    
+    This verification link will expire in 1 hour.
+    
+    If you didn't create an account with Consistency Tracker, please ignore this email.
+    
+""")
+
+_EMAIL_VERIFICATION_SUBJECT = "Verify Your Email - Consistency Tracker"
+
+# Email kind -> precompiled templates; the get_*_template functions below
+# are thin wrappers that pass their arguments to _render
+_TEMPLATES = {
+    "password_reset": _EmailSpec(_PASSWORD_RESET_HTML, _PASSWORD_RESET_TEXT, _PASSWORD_RESET_SUBJECT),
+    "user_invitation": _invitation(
+        "You have been invited to join Consistency Tracker as a $role.",
+        "You have been invited to join Consistency Tracker as a $role.",
+        "",
+        "Welcome to Consistency Tracker - $role_title Account Created",
+    ),
+    "club_creation": _EmailSpec(_CLUB_CREATION_HTML, _CLUB_CREATION_TEXT, _CLUB_CREATION_SUBJECT),
+    "team_creation": _EmailSpec(_TEAM_CREATION_HTML, _TEAM_CREATION_TEXT, _TEAM_CREATION_SUBJECT),
+    "player_invitation": _invitation(
+        "You have been invited to join <strong>$team_name</strong> in <strong>$club_name</strong> on Consistency Tracker.",
+        "You have been invited to join $team_name in $club_name on Consistency Tracker.",
+        " and can start tracking your consistency",
+        "Welcome to $team_name - Consistency Tracker",
+    ),
+    "coach_invitation": _invitation(
+        "You have been invited to join <strong>$team_name</strong> in <strong>$club_name</strong> as a coach.",
+        "You have been invited to join $team_name in $club_name as a coach.",
+        " and can start managing your team",
+        "Welcome to $team_name - Coach Account Created",
+    ),
+    "email_verification": _EmailSpec(_EMAIL_VERIFICATION_HTML, _EMAIL_VERIFICATION_TEXT, _EMAIL_VERIFICATION_SUBJECT),
+}
+
+
+def _html_fields(fields: Dict[str, str]) -> Dict[str, str]:
     """
+    HTML-escape field values for the HTML body.
     
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": f"Team Created: {team_name}"
-    }
+    Quotes are escaped too, so URLs are safe inside href="...". The text body
+    and subject are plain text and get the raw values.
+    """
+    return {name: escape(str(value)) for name, value in fields.items()}
+
+
+def _bind(template: Template, fields: Dict[str, str]) -> Template:
+    """Substitute some fields now, leaving the other placeholders for later."""
+    # "$" in a value would otherwise start a placeholder in the new Template
+    literal = {name: str(value).replace("$", "$$") for name, value in fields.items()}
+    return Template(template.safe_substitute(literal))
+
+
+def _render_spec(spec: _EmailSpec, fields: Dict[str, str]) -> EmailPayload:
+    """Render the HTML, text and subject of an _EmailSpec."""
+    subject = spec.subject
+    if not isinstance(subject, str):
+        subject = subject.substitute(fields)
+    return EmailPayload(
+        html=spec.html.substitute(_html_fields(fields)),
+        text=spec.text.substitute(fields),
+        subject=subject,
+    )
+
+
+def _render(kind: str, **fields: str) -> EmailPayload:
+    """Render the HTML, text and subject of a _TEMPLATES entry."""
+    return _render_spec(_TEMPLATES[kind], fields)
+
+
+def get_password_reset_template(reset_link: str, user_name: str = "User") -> EmailPayload:
+    """Generate password reset email template."""
+    return _render("password_reset", reset_link=reset_link, user_name=user_name)
+
+
+def get_user_invitation_template(
+    user_name: str,
+    email: str,
+    temporary_password: str,
+    login_url: str,
+    role: str = "administrator"
+) -> EmailPayload:
+    """Generate user invitation email template."""
+    return _render(
+        "user_invitation",
+        name=user_name,
+        email=email,
+        temporary_password=temporary_password,
+        login_url=login_url,
+        role=role,
+        role_title=role.title(),
+    )
+
+
+def get_club_creation_template(club_name: str, club_id: str, admin_email: str) -> EmailPayload:
+    """Generate club creation confirmation email template."""
+    return _render("club_creation", club_name=club_name, club_id=club_id, admin_email=admin_email)
+
+
+def get_team_creation_template(team_name: str, club_name: str, team_id: str) -> EmailPayload:
+    """Generate team creation confirmation email template."""
+    return _render("team_creation", team_name=team_name, club_name=club_name, team_id=team_id)
 
 
 def get_player_invitation_template(
@@ -237,65 +374,52 @@ def get_player_invitation_template(
     login_url: str,
     team_name: str,
     club_name: str
-) -> dict:
+) -> EmailPayload:
     """Generate player invitation email template."""
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Welcome to Consistency Tracker</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Welcome to Consistency Tracker</h1>
-        </div>
-        <p>Hello {player_name},</p>
-        <p>You have been invited to join <strong>{team_name}</strong> in <strong>{club_name}</strong> on Consistency Tracker.</p>
-        <p>Your account has been created with the following credentials:</p>
-        <div style="background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0;">
-            <p style="margin: 5px 0;"><strong>Email:</strong> {email}</p>
-            <p style="margin: 5px 0;"><strong>Temporary Password:</strong> {temporary_password}</p>
-        </div>
-        <p><strong>Important:</strong> You must change your password on first login.</p>
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{login_url}" style="background-color: #27ae60; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Login Now</a>
-        </div>
-        <p>After logging in, you'll be prompted to set a new password and can start tracking your consistency.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
+    return _render(
+        "player_invitation",
+        name=player_name,
+        email=email,
+        temporary_password=temporary_password,
+        login_url=login_url,
+        team_name=team_name,
+        club_name=club_name,
+    )
+
+
+def render_player_invitations(team_name: str, club_name: str, players: List[dict]) -> List[EmailPayload]:
     """
+    Render player invitation emails for several players of one team.
     
-    text_body = f"""
-    Welcome to Consistency Tracker
-    
-    Hello {player_name},
-    
-    You have been invited to join {team_name} in {club_name} on Consistency Tracker.
-    
-    Your account has been created with the following credentials:
-    
-    Email: {email}
-    Temporary Password: {temporary_password}
-    
-    Important: You must change your password on first login.
-    
-    Login at: {login_url}
+    Produces the same emails as calling get_player_invitation_template for
+    each player, but the team and club names are escaped and substituted
+    once for the whole batch, leaving only the per-player fields per email.
     
-    After logging in, you'll be prompted to set a new password and can start tracking your consistency.
+    Args:
+        team_name: Team the players are invited to
+        club_name: Club the team belongs to
+        players: List of dicts with 'player_name', 'email',
+            'temporary_password' and 'login_url'
     
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
+    Returns:
+        List of EmailPayload, in player order
     """
-    
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": f"Welcome to {team_name} - Consistency Tracker"
-    }
+    shared = {"team_name": team_name, "club_name": club_name}
+    spec = _TEMPLATES["player_invitation"]
+    spec = _EmailSpec(
+        _bind(spec.html, _html_fields(shared)),
+        _bind(spec.text, shared),
+        _bind(spec.subject, shared),
+    )
+    return [
+        _render_spec(spec, {
+            "name": player["player_name"],
+            "email": player["email"],
+            "temporary_password": player["temporary_password"],
+            "login_url": player["login_url"],
+        })
+        for player in players
+    ]
 
 
 def get_coach_invitation_template(
@@ -305,118 +429,24 @@ def get_coach_invitation_template(
     login_url: str,
     team_name: str,
     club_name: str
-) -> dict:
+) -> EmailPayload:
     """Generate coach invitation email template."""
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Welcome to Consistency Tracker</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Welcome to Consistency Tracker</h1>
-        </div>
-        <p>Hello {coach_name},</p>
-        <p>You have been invited to join <strong>{team_name}</strong> in <strong>{club_name}</strong> as a coach.</p>
-        <p>Your account has been created with the following credentials:</p>
-        <div style="background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0;">
-            <p style="margin: 5px 0;"><strong>Email:</strong> {email}</p>
-            <p style="margin: 5px 0;"><strong>Temporary Password:</strong> {temporary_password}</p>
-        </div>
-        <p><strong>Important:</strong> You must change your password on first login.</p>
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{login_url}" style="background-color: #27ae60; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Login Now</a>
-        </div>
-        <p>After logging in, you'll be prompted to set a new password and can start managing your team.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_body = f"""
-    Welcome to Consistency Tracker
-    
-    Hello {coach_name},
-    
-    You have been invited to join {team_name} in {club_name} as a coach.
-    
-    Your account has been created with the following credentials:
-    
-    Email: {email}
-    Temporary Password: {temporary_password}
-    
-    Important: You must change your password on first login.
-    
-    Login at: {login_url}
-    
-    After logging in, you'll be prompted to set a new password and can start managing your team.
-    
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
-    """
-    
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": f"Welcome to {team_name} - Coach Account Created"
-    }
+    return _render(
+        "coach_invitation",
+        name=coach_name,
+        email=email,
+        temporary_password=temporary_password,
+        login_url=login_url,
+        team_name=team_name,
+        club_name=club_name,
+    )
 
 
-def get_email_verification_template(email: str, verification_url: str, user_name: str = "User") -> dict:
+def get_email_verification_template(email: str, verification_url: str, user_name: str = "User") -> EmailPayload:
     """Generate email verification email template."""
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Verify Your Email - Consistency Tracker</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #2c3e50; margin-top: 0;">Verify Your Email Address</h1>
-        </div>
-        <p>Hello {user_name},</p>
-        <p>Thank you for joining Consistency Tracker! Please verify your email address to complete your account setup and start using the platform.</p>
-        <p>Click the button below to verify your email address:</p>
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{verification_url}" style="background-color: #27ae60; color: white; padding: 12px 30px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Verify Email Address</a>
-        </div>
-        <p>Or copy and paste this link into your browser:</p>
-        <p style="word-break: break-all; color: #7f8c8d; font-size: 12px;">{verification_url}</p>
-        <p>This verification link will expire in 1 hour.</p>
-        <p>If you didn't create an account with Consistency Tracker, please ignore this email.</p>
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-        <p style="color: #7f8c8d; font-size: 12px;">This is an automated message from Consistency Tracker. Please do not reply to this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_body = f"""
-    Verify Your Email Address - Consistency Tracker
-    
-    Hello {user_name},
-    
-    Thank you for joining Consistency Tracker! Please verify your email address to complete your account setup and start using the platform.
-    
-    Click the link below to verify your email address:
-    {verification_url}
-    
-    This verification link will expire in 1 hour.
-    
-    If you didn't create an account with Consistency Tracker, please ignore this email.
-    
-    ---
-    This is an automated message from Consistency Tracker. Please do not reply to this email.
-    """
-    
-    return {
-        "html": html_body,
-        "text": text_body,
-        "subject": "Verify Your Email - Consistency Tracker"
-    }
-
+    return _render(
+        "email_verification",
+        email=email,
+        verification_url=verification_url,
+        user_name=user_name,
+    )
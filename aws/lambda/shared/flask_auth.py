@@ -5,12 +5,16 @@ Provides decorators and helpers for Flask applications that integrate with
 existing auth_utils functions and API Gateway Cognito authorizer.
 """
 
+import os
+import logging
 from functools import wraps
 from flask import request, g, abort, jsonify
 from typing import Optional, Dict, Any
 from shared.auth_utils import (
     extract_user_info_from_event,
     extract_user_info_from_jwt_token,
+    clear_user_info_cache,
+    normalize_groups,
     verify_admin_role,
     verify_app_admin_role,
     get_club_id_from_user,
@@ -18,6 +22,9 @@ from shared.auth_utils import (
 )
 # Import get_club_by_id lazily to avoid import issues at module load time
 
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
+
 
 def get_api_gateway_event() -> Dict[str, Any]:
     """
@@ -31,6 +38,22 @@ def get_api_gateway_event() -> Dict[str, Any]:
     return request.environ.get('serverless.event', {})
 
 
+def _get_club_or_none(club_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a club for the disabled check, or None if it cannot be read.
+
+    Lookup failures are logged and treated as "not disabled" (fail open), so
+    transient DB issues do not block access.
+    """
+    try:
+        # Lazy import to avoid import issues at module load time
+        from shared.db_utils import get_club_by_id
+        return get_club_by_id(club_id)
+    except Exception as e:
+        logger.warning("Could not check club disabled status: %s", e)
+        return None
+
+
 def require_admin(f):
     """
     Decorator to require admin authentication.
@@ -58,31 +81,22 @@ def require_admin(f):
             if auth_header.startswith('Bearer '):
                 token = auth_header[7:]  # Remove 'Bearer ' prefix
                 user_info = extract_user_info_from_jwt_token(token)
-                print(f"DEBUG require_admin: Extracted user_info from Authorization header")
+                logger.debug("require_admin: Extracted user_info from Authorization header")
         
         if not user_info:
             abort(401, description="Authentication required")
         
         # Ensure event has authorizer context for verify_admin_role
         # verify_admin_role expects event with authorizer.claims containing cognito:groups
-        if not event.get("requestContext", {}).get("authorizer", {}).get("claims", {}).get("cognito:groups"):
+        claims = event.get("requestContext", {}).get("authorizer", {}).get("claims")
+        if not (claims and claims.get("cognito:groups")):
             # If no groups in authorizer context, create one from user_info
-            if not event.get("requestContext"):
-                event["requestContext"] = {}
-            if not event["requestContext"].get("authorizer"):
-                event["requestContext"]["authorizer"] = {}
-            if not event["requestContext"]["authorizer"].get("claims"):
-                event["requestContext"]["authorizer"]["claims"] = {}
+            authorizer = event.setdefault("requestContext", {}).setdefault("authorizer", {})
+            if not claims:
+                claims = authorizer["claims"] = {}
             
             # Update claims with user_info - ensure groups is a list
-            claims = event["requestContext"]["authorizer"]["claims"]
-            groups_raw = user_info.get("groups", [])
-            if isinstance(groups_raw, str):
-                groups = [g.strip() for g in groups_raw.split(",") if g.strip()]
-            elif isinstance(groups_raw, list):
-                groups = groups_raw
-            else:
-                groups = []
+            groups = normalize_groups(user_info.get("groups"))
             
             claims["cognito:username"] = user_info.get("username")
             claims["email"] = user_info.get("email")
@@ -93,7 +107,12 @@ def require_admin(f):
                 claims["custom:clubId"] = user_info.get("custom:clubId")
             if user_info.get("custom:teamIds"):
                 claims["custom:teamIds"] = user_info.get("custom:teamIds")
-            print(f"DEBUG require_admin: Created authorizer claims from user_info, groups: {groups}, clubId: {claims.get('custom:clubId')}")
+            logger.debug(
+                "require_admin: Created authorizer claims from user_info, groups: %s, clubId: %s",
+                groups, claims.get("custom:clubId"),
+            )
+            # The event's memoized user info predates these claims
+            clear_user_info_cache(event)
             
             # Store modified event back to request.environ if it wasn't there originally
             if not event_exists:
@@ -106,22 +125,11 @@ def require_admin(f):
         email = user_info.get("email")
         if email:
             # Lazy import to avoid circular dependencies
-            from shared.db_utils import get_coach_by_email, get_club_admin_by_email
-            
-            # Check if user is a coach
-            coach = get_coach_by_email(email)
-            if coach:
-                verification_status = coach.get("verificationStatus")
-                if verification_status == "pending":
-                    abort(403, description="Account verification pending. Please complete email verification and password setup.")
+            from shared.db_utils import get_verification_status_by_email
             
-            # Check if user is a club-admin (only if not a coach)
-            if not coach:
-                admin = get_club_admin_by_email(email)
-                if admin:
-                    verification_status = admin.get("verificationStatus")
-                    if verification_status == "pending":
-                        abort(403, description="Account verification pending. Please complete email verification and password setup.")
+            # Coaches and club-admins must finish verification first
+            if get_verification_status_by_email(email) == "pending":
+                abort(403, description="Account verification pending. Please complete email verification and password setup.")
         
         # Store user info in Flask's g object
         g.current_user = user_info
@@ -168,7 +176,8 @@ def require_club(f):
     
     Must be used after @require_admin. Validates that the user
     is associated with a club and the club is not disabled.
-    App-admins can bypass this requirement.
+    App-admins can bypass this requirement. Stores the user's club
+    in g.current_club for reuse.
     
     Usage:
         @app.route('/admin/endpoint')
@@ -195,16 +204,9 @@ def require_club(f):
             abort(403, description="User not associated with a club")
         
         # Check if club is disabled (app-admins can still access disabled clubs)
-        try:
-            # Lazy import to avoid import issues at module load time
-            from shared.db_utils import get_club_by_id
-            club = get_club_by_id(g.club_id)
-            if club and club.get("isDisabled", False):
-                abort(403, description="Club is disabled")
-        except Exception as e:
-            # If we can't check club status, allow access (fail open)
-            # This prevents blocking access due to transient DB issues
-            print(f"Warning: Could not check club disabled status: {e}")
+        g.current_club = _get_club_or_none(g.club_id)
+        if g.current_club and g.current_club.get("isDisabled", False):
+            abort(403, description="Club is disabled")
         
         return f(*args, **kwargs)
     return decorated_function
@@ -242,16 +244,12 @@ def require_club_access(club_id_param: str = 'club_id'):
             # Check if club is disabled (app-admins can still access disabled clubs)
             is_app_admin = getattr(g, 'is_app_admin', False)
             if not is_app_admin and requested_club_id:
-                try:
-                    # Lazy import to avoid import issues at module load time
-                    from shared.db_utils import get_club_by_id
-                    club = get_club_by_id(requested_club_id)
-                    if club and club.get("isDisabled", False):
-                        abort(403, description="Club is disabled")
-                except Exception as e:
-                    # If we can't check club status, allow access (fail open)
-                    # This prevents blocking access due to transient DB issues
-                    print(f"Warning: Could not check club disabled status: {e}")
+                # require_club already loaded the user's own club
+                club = getattr(g, 'current_club', None)
+                if club is None or requested_club_id != user_club_id:
+                    club = _get_club_or_none(requested_club_id)
+                if club and club.get("isDisabled", False):
+                    abort(403, description="Club is disabled")
             
             return f(*args, **kwargs)
         return decorated_function
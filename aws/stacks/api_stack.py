@@ -140,6 +140,7 @@ class ApiStack(Stack):
             "TEAM_TABLE": self.database_stack.team_table.table_name,
             "CLUB_TABLE": self.database_stack.club_table.table_name,
             "EMAIL_VERIFICATION_TABLE": self.database_stack.email_verification_table.table_name,
+            "EMAIL_VERIFICATION_STATE_TABLE": self.database_stack.email_verification_state_table.table_name,
             "VERIFICATION_ATTEMPTS_TABLE": self.database_stack.verification_attempts_table.table_name,
             "RESEND_TRACKING_TABLE": self.database_stack.resend_tracking_table.table_name,
             "COGNITO_USER_POOL_ID": self.auth_stack.user_pool.user_pool_id,
@@ -188,6 +189,7 @@ class ApiStack(Stack):
         self.database_stack.team_table.grant_read_data(player_role)
         self.database_stack.club_table.grant_read_data(player_role)
         self.database_stack.email_verification_table.grant_read_write_data(player_role)
+        self.database_stack.email_verification_state_table.grant_read_write_data(player_role)
         
         # Grant SES permissions if SES stack is provided
         if ses_stack:
@@ -240,6 +242,7 @@ class ApiStack(Stack):
             "TEAM_TABLE": self.database_stack.team_table.table_name,
             "CLUB_TABLE": self.database_stack.club_table.table_name,
             "EMAIL_VERIFICATION_TABLE": self.database_stack.email_verification_table.table_name,
+            "EMAIL_VERIFICATION_STATE_TABLE": self.database_stack.email_verification_state_table.table_name,
             "VERIFICATION_ATTEMPTS_TABLE": self.database_stack.verification_attempts_table.table_name,
             "RESEND_TRACKING_TABLE": self.database_stack.resend_tracking_table.table_name,
             "COGNITO_USER_POOL_ID": self.auth_stack.user_pool.user_pool_id,
@@ -291,6 +294,7 @@ class ApiStack(Stack):
         self.database_stack.coach_table.grant_read_write_data(admin_role)
         self.database_stack.club_admin_table.grant_read_write_data(admin_role)
         self.database_stack.email_verification_table.grant_read_write_data(admin_role)
+        self.database_stack.email_verification_state_table.grant_read_write_data(admin_role)
         self.database_stack.verification_attempts_table.grant_read_write_data(admin_role)
         self.database_stack.resend_tracking_table.grant_read_write_data(admin_role)
 
@@ -329,6 +333,7 @@ class ApiStack(Stack):
                     actions=[
                         "ses:SendEmail",
                         "ses:SendRawEmail",
+                        "ses:GetSendQuota",
                         "ses:VerifyEmailIdentity",
                     ],
                     resources=["*"],
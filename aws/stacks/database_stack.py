@@ -64,6 +64,27 @@ class DatabaseStack(Stack):
             ),
         )
 
+        # GSI: uniqueLink for resolving a player's tracking link
+        self.player_table.add_global_secondary_index(
+            index_name="uniqueLink-index",
+            partition_key=dynamodb.Attribute(
+                name="uniqueLink", type=dynamodb.AttributeType.STRING
+            ),
+        )
+
+        # GSI: email for looking up players by email (JWT login, verification)
+        # CloudFormation adds only one GSI per table per stack update, and
+        # uniqueLink-index above is new in the same release. Deploy once with
+        # this off, then set "player_email_index" to true in cdk.json and
+        # deploy again. get_player_by_email falls back to a scan until then.
+        if self.node.try_get_context("player_email_index"):
+            self.player_table.add_global_secondary_index(
+                index_name="email-index",
+                partition_key=dynamodb.Attribute(
+                    name="email", type=dynamodb.AttributeType.STRING
+                ),
+            )
+
         # Activity Table
         # Partition Key: activityId
         # GSI: teamId (for querying all activities for a team)
@@ -212,6 +233,17 @@ class DatabaseStack(Stack):
             ),
         )
 
+        # GSI: teamId + slug for resolving a team's page by slug
+        self.content_pages_table.add_global_secondary_index(
+            index_name="teamId-slug-index",
+            partition_key=dynamodb.Attribute(
+                name="teamId", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="slug", type=dynamodb.AttributeType.STRING
+            ),
+        )
+
         # Team/Config Table
         # Partition Key: teamId
         # GSI: clubId (for querying all teams in a club)
@@ -330,6 +362,22 @@ class DatabaseStack(Stack):
             ),
         )
 
+        # Email Verification State Table
+        # One item per email holding currentEpoch; tokens embed the epoch they
+        # were issued under, so bumping it invalidates every pending token at once
+        # Partition Key: email (String)
+        self.email_verification_state_table = dynamodb.Table(
+            self,
+            "EmailVerificationStateTable",
+            table_name="ConsistencyTracker-EmailVerificationState",
+            partition_key=dynamodb.Attribute(
+                name="email", type=dynamodb.AttributeType.STRING
+            ),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            point_in_time_recovery=True,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
         # Verification Attempts Table
         # Tracks failed verification attempts per IP address for brute-force protection
         # Partition Key: ipAddress (String)
@@ -56,6 +56,7 @@ class SesStack(Stack):
                 actions=[
                     "ses:SendEmail",
                     "ses:SendRawEmail",
+                    "ses:GetSendQuota",
                 ],
                 resources=["*"],  # SES doesn't support resource-level permissions
             )